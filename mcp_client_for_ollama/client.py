@@ -15,7 +15,7 @@ import ollama
 
 from . import __version__
 from .config.manager import ConfigManager
-from .utils.version import check_for_updates
+from .utils.version import check_for_updates, start_update_check
 from .utils.constants import DEFAULT_CLAUDE_CONFIG, DEFAULT_MODEL, DEFAULT_OLLAMA_HOST, THINKING_MODELS, DEFAULT_COMPLETION_STYLE
 from .server.connector import ServerConnector
 from .models.manager import ModelManager
@@ -69,6 +69,8 @@ class MCPClient:
         self.show_tool_execution = True  # By default, show tool execution displays
         # Metrics display settings
         self.show_metrics = False  # By default, don't show metrics after each query
+        # Markdown rendering settings
+        self.render_markdown = True  # By default, render responses as Markdown
         self.default_configuration_status = False  # Track if default configuration was loaded successfully
 
         # Store server connection parameters for reloading
@@ -263,7 +265,8 @@ class MCPClient:
             stream,
             thinking_mode=self.thinking_mode,
             show_thinking=self.show_thinking,
-            show_metrics=self.show_metrics
+            show_metrics=self.show_metrics,
+            markdown=self.render_markdown
         )
 
         # Update actual token count from metrics if available
@@ -276,7 +279,8 @@ class MCPClient:
                 tool_args = tool.function.arguments
 
                 # Parse server name and actual tool name from the qualified name
-                server_name, actual_tool_name = tool_name.split('.', 1) if '.' in tool_name else (None, tool_name)
+                head, sep, tail = tool_name.partition('.')
+                server_name, actual_tool_name = (head, tail) if sep else (None, head)
 
                 if not server_name or server_name not in self.sessions:
                     self.console.print(f"[red]Error: Unknown server for tool {tool_name}[/red]")
@@ -335,7 +339,8 @@ class MCPClient:
                 stream,
                 thinking_mode=self.thinking_mode,
                 show_thinking=self.show_thinking,
-                show_metrics=self.show_metrics
+                show_metrics=self.show_metrics,
+                markdown=self.render_markdown
             )
 
             # Update actual token count from followup metrics if available
@@ -396,6 +401,8 @@ class MCPClient:
 
     async def chat_loop(self):
         """Run an interactive chat loop"""
+        # Refresh the update check cache in the background; the banner reads the cached result
+        start_update_check()
         self.clear_console()
         self.console.print(Panel(Text.from_markup("[bold green]Welcome to the MCP Client for Ollama 🦙[/bold green]", justify="center"), expand=True, border_style="green"))
         self.display_available_tools()
@@ -449,6 +456,10 @@ class MCPClient:
                     self.toggle_show_metrics()
                     continue
 
+                if query.lower() in ['render-markdown', 'md']:
+                    self.toggle_render_markdown()
+                    continue
+
                 if query.lower() in ['clear', 'cc']:
                     self.clear_context()
                     continue
@@ -546,7 +557,8 @@ class MCPClient:
             "• Type [bold]model-config[/bold] or [bold]mc[/bold] to configure system prompt and model parameters\n"
             f"• Type [bold]thinking-mode[/bold] or [bold]tm[/bold] to toggle thinking mode [{', '.join(THINKING_MODELS)}]\n"
             "• Type [bold]show-thinking[/bold] or [bold]st[/bold] to toggle thinking text visibility\n"
-            "• Type [bold]show-metrics[/bold] or [bold]sm[/bold] to toggle performance metrics display\n\n"
+            "• Type [bold]show-metrics[/bold] or [bold]sm[/bold] to toggle performance metrics display\n"
+            "• Type [bold]render-markdown[/bold] or [bold]md[/bold] to toggle Markdown rendering of responses\n\n"
 
             "[bold cyan]MCP Servers and Tools:[/bold cyan]\n"
             "• Type [bold]tools[/bold] or [bold]t[/bold] to configure tools\n"
@@ -656,6 +668,17 @@ class MCPClient:
         else:
             self.console.print("[cyan]🔇 Performance metrics will be hidden for a cleaner output.[/cyan]")
 
+    def toggle_render_markdown(self):
+        """Toggle whether responses are rendered as Markdown"""
+        self.render_markdown = not self.render_markdown
+        status = "enabled" if self.render_markdown else "disabled"
+        self.console.print(f"[green]Markdown rendering {status}![/green]")
+
+        if self.render_markdown:
+            self.console.print("[cyan]📝 Responses will be rendered as Markdown.[/cyan]")
+        else:
+            self.console.print("[cyan]📄 Responses will be shown as plain text.[/cyan]")
+
     def clear_context(self):
         """Clear conversation history and token count"""
         original_history_length = len(self.chat_history)
@@ -681,6 +704,7 @@ class MCPClient:
             f"{thinking_status}"
             f"Tool execution display: [{'green' if self.show_tool_execution else 'red'}]{'Enabled' if self.show_tool_execution else 'Disabled'}[/{'green' if self.show_tool_execution else 'red'}]\n"
             f"Performance metrics: [{'green' if self.show_metrics else 'red'}]{'Enabled' if self.show_metrics else 'Disabled'}[/{'green' if self.show_metrics else 'red'}]\n"
+            f"Markdown rendering: [{'green' if self.render_markdown else 'red'}]{'Enabled' if self.render_markdown else 'Disabled'}[/{'green' if self.render_markdown else 'red'}]\n"
             f"Human-in-the-Loop confirmations: [{'green' if self.hil_manager.is_enabled() else 'red'}]{'Enabled' if self.hil_manager.is_enabled() else 'Disabled'}[/{'green' if self.hil_manager.is_enabled() else 'red'}]\n"
             f"Conversation entries: {history_count}\n"
             f"Total tokens generated: {self.actual_token_count:,}",
@@ -719,7 +743,8 @@ class MCPClient:
             "modelConfig": self.model_config_manager.get_config(),
             "displaySettings": {
                 "showToolExecution": self.show_tool_execution,
-                "showMetrics": self.show_metrics
+                "showMetrics": self.show_metrics,
+                "renderMarkdown": self.render_markdown
             },
             "hilSettings": {
                 "enabled": self.hil_manager.is_enabled()
@@ -783,6 +808,8 @@ class MCPClient:
                 self.show_tool_execution = config_data["displaySettings"]["showToolExecution"]
             if "showMetrics" in config_data["displaySettings"]:
                 self.show_metrics = config_data["displaySettings"]["showMetrics"]
+            if "renderMarkdown" in config_data["displaySettings"]:
+                self.render_markdown = config_data["displaySettings"]["renderMarkdown"]
 
         # Load HIL settings if specified
         if "hilSettings" in config_data:
@@ -831,6 +858,11 @@ class MCPClient:
             else:
                 # Default show metrics to False if not specified
                 self.show_metrics = False
+            if "renderMarkdown" in config_data["displaySettings"]:
+                self.render_markdown = config_data["displaySettings"]["renderMarkdown"]
+            else:
+                # Default render markdown to True if not specified
+                self.render_markdown = True
 
         # Reset HIL settings from the default configuration
         if "hilSettings" in config_data:
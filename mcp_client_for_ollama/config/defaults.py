@@ -41,7 +41,8 @@ def default_config() -> dict:
         },
         "displaySettings": {
             "showToolExecution": True,
-            "showMetrics": False
+            "showMetrics": False,
+            "renderMarkdown": True
         },
         "hilSettings": {
             "enabled": True
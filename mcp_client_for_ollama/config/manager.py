@@ -65,6 +65,9 @@ class ConfigManager:
         # Sanitize filename
         config_name = self._sanitize_config_name(config_name)
 
+        # Create config directory if it doesn't exist
+        self._ensure_config_dir()
+
         # Create config file path
         config_path = self._get_config_path(config_name)
 
@@ -105,7 +108,7 @@ class ConfigManager:
             bool: True if saved successfully, False otherwise
         """
         # Create config directory if it doesn't exist
-        os.makedirs(DEFAULT_CONFIG_DIR, exist_ok=True)
+        self._ensure_config_dir()
 
         # Default to 'default' if no config name provided
         if not config_name:
@@ -168,6 +171,10 @@ class ConfigManager:
         sanitized = ''.join(c for c in config_name if c.isalnum() or c in ['-', '_']).lower()
         return sanitized or "default"
 
+    def _ensure_config_dir(self) -> None:
+        """Create the configuration directory if it does not exist yet."""
+        os.makedirs(DEFAULT_CONFIG_DIR, exist_ok=True)
+
     def _get_config_path(self, config_name: str) -> str:
         """Get the full path to a configuration file.
 
@@ -247,6 +254,8 @@ class ConfigManager:
                 validated["displaySettings"]["showToolExecution"] = bool(config_data["displaySettings"]["showToolExecution"])
             if "showMetrics" in config_data["displaySettings"]:
                 validated["displaySettings"]["showMetrics"] = bool(config_data["displaySettings"]["showMetrics"])
+            if "renderMarkdown" in config_data["displaySettings"]:
+                validated["displaySettings"]["renderMarkdown"] = bool(config_data["displaySettings"]["renderMarkdown"])
 
         if "hilSettings" in config_data and isinstance(config_data["hilSettings"], dict):
             if "enabled" in config_data["hilSettings"]:
@@ -351,6 +351,17 @@ class ServerConnector:
         if tool_name in self.enabled_tools:
             self.enabled_tools[tool_name] = enabled
 
+    def set_tool_statuses(self, tool_status: Dict[str, bool]):
+        """Set the enabled status of multiple tools in a single call
+
+        Args:
+            tool_status: Dict mapping tool names to enabled status
+        """
+        enabled_tools = self.enabled_tools
+        for tool_name, enabled in tool_status.items():
+            if tool_name in enabled_tools:
+                enabled_tools[tool_name] = enabled
+
     def enable_all_tools(self):
         """Enable all available tools"""
         for tool_name in self.enabled_tools:
@@ -4,14 +4,83 @@ This module handles enabling, disabling, and selecting tools from MCP servers.
 """
 
 import json
-from typing import Dict, List, Optional, Tuple, Callable
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union, Callable
 from mcp import Tool
-from rich.console import Console
-from rich.columns import Columns
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.text import Text
-from rich.syntax import Syntax
+
+# Rich renderables are imported where they are used so that creating a
+# ToolManager without displaying anything does not pay for importing Rich
+if TYPE_CHECKING:
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+# Parser states used by _iter_selection
+_SEL_EMPTY, _SEL_START, _SEL_AFTER_START, _SEL_DASH, _SEL_END, _SEL_AFTER_END, _SEL_INVALID = range(7)
+
+
+def _iter_selection(selection: str) -> Iterator[Union[int, Tuple[int, int], str]]:
+    """Parse a comma separated tool selection such as "1,3,5-8" in a single pass.
+
+    Args:
+        selection: User selection string
+
+    Yields:
+        An int for each number, a (start, end) tuple for each range and the
+        stripped text of each part that is neither. Empty parts are skipped.
+    """
+    state = _SEL_EMPTY
+    start = end = 0
+    part_start = 0
+
+    for pos, char in enumerate(selection + ','):
+        if char == ',':
+            if state in (_SEL_START, _SEL_AFTER_START):
+                yield start
+            elif state in (_SEL_END, _SEL_AFTER_END):
+                yield start, end
+            elif state != _SEL_EMPTY:
+                yield selection[part_start:pos].strip()
+            state = _SEL_EMPTY
+            start = end = 0
+            part_start = pos + 1
+        elif state == _SEL_INVALID:
+            continue
+        elif '0' <= char <= '9':
+            digit = ord(char) - 48
+            if state in (_SEL_EMPTY, _SEL_START):
+                start = start * 10 + digit
+                state = _SEL_START
+            elif state in (_SEL_DASH, _SEL_END):
+                end = end * 10 + digit
+                state = _SEL_END
+            else:
+                state = _SEL_INVALID
+        elif char.isspace():
+            if state == _SEL_START:
+                state = _SEL_AFTER_START
+            elif state == _SEL_END:
+                state = _SEL_AFTER_END
+        elif char == '-' and state in (_SEL_START, _SEL_AFTER_START):
+            state = _SEL_DASH
+        else:
+            state = _SEL_INVALID
+
+# Tool lists up to this size are shown one per line instead of in Rich Columns
+_MAX_TOOLS_WITHOUT_COLUMNS = 8
+
+# Number of server panels kept for reuse across tool selection redraws
+_PANEL_CACHE_SIZE = 32
+
+# Tool selection command aliases mapped to their canonical command name
+_COMMAND_ALIASES = {
+    's': 'save', 'save': 'save',
+    'q': 'quit', 'quit': 'quit',
+    'a': 'all', 'all': 'all',
+    'n': 'none', 'none': 'none',
+    'd': 'desc', 'desc': 'desc',
+    'j': 'json', 'json': 'json',
+}
 
 class ToolManager:
     """Manages MCP tools.
@@ -20,17 +89,47 @@ class ToolManager:
     an interactive interface, and organizing tools by server.
     """
 
-    def __init__(self, console: Optional[Console] = None, server_connector=None):
+    def __init__(self, console: Optional["Console"] = None, server_connector=None):
         """Initialize the ToolManager.
 
         Args:
             console: Rich console for output (optional)
             server_connector: Server connector to notify of tool state changes (optional)
         """
-        self.console = console or Console()
+        if console is None:
+            from rich.console import Console
+            console = Console()
+        self.console = console
         self.available_tools = []
         self.enabled_tools = {}
         self.server_connector = server_connector
+        # Tools grouped by server, rebuilt only when the available tools change
+        self._servers_grouped: Dict[str, List[Tool]] = {}
+        self._sorted_servers: List[Tuple[str, List[Tool]]] = []
+        # Per-server bitmaps of enabled tools (bit i = i-th tool of the server)
+        self._server_bitmap: Dict[str, int] = {}
+        self._server_mask: Dict[str, int] = {}
+        self._tool_bits: Dict[str, Tuple[str, int]] = {}
+        # Static renderables for the tool selection screen, built on first use
+        self._header_cached: Optional["Group"] = None
+        self._help_cached: Dict[bool, "Group"] = {}
+        # Most recently used server panels, keyed by server and tool states
+        self._panel_cache: "OrderedDict[tuple, Panel]" = OrderedDict()
+        # State of the current tool selection session
+        self._original_states: Dict[str, bool] = {}
+        self._show_descriptions = False
+        # Cached result of get_enabled_tool_objects, valid while the versions match
+        self._enabled_version = 0
+        self._enabled_cache: Optional[List[Tool]] = None
+        self._enabled_cache_version = -1
+        self._command_handlers: Dict[str, Callable] = {
+            'save': self._cmd_save,
+            'quit': self._cmd_quit,
+            'all': self._cmd_all,
+            'none': self._cmd_none,
+            'desc': self._cmd_desc,
+            'json': self._cmd_json,
+        }
 
     def set_available_tools(self, tools: List[Tool]) -> None:
         """Set the available tools.
@@ -39,6 +138,54 @@ class ToolManager:
             tools: List of available tools
         """
         self.available_tools = tools
+        self._group_tools_by_server()
+        self._rebuild_server_bitmaps()
+        self._panel_cache.clear()
+        self._mark_enabled_changed()
+
+    def _group_tools_by_server(self) -> None:
+        """Group the available tools by server and cache the sorted result."""
+        servers = {}
+        for tool in self.available_tools:
+            head, sep, _ = tool.name.partition('.')
+            server_name = head if sep else "default"
+            servers.setdefault(server_name, []).append(tool)
+
+        self._servers_grouped = servers
+        # Sort servers by name for consistent display
+        self._sorted_servers = sorted(servers.items(), key=lambda x: x[0])
+
+        # Assign each tool a bit within its server's bitmap
+        self._tool_bits = {}
+        self._server_mask = {}
+        for server_name, server_tools in servers.items():
+            for bit_index, tool in enumerate(server_tools):
+                self._tool_bits[tool.name] = (server_name, 1 << bit_index)
+            self._server_mask[server_name] = (1 << len(server_tools)) - 1
+
+    def _rebuild_server_bitmaps(self) -> None:
+        """Rebuild the per-server enabled bitmaps from enabled_tools."""
+        enabled = self.enabled_tools
+        bitmaps = dict.fromkeys(self._servers_grouped, 0)
+        for tool_name, (server_name, bit) in self._tool_bits.items():
+            if enabled.get(tool_name, False):
+                bitmaps[server_name] |= bit
+        self._server_bitmap = bitmaps
+
+    def _set_tool_bit(self, tool_name: str, enabled: bool) -> None:
+        """Update the enabled bit of a single tool in its server bitmap.
+
+        Args:
+            tool_name: Name of the tool that changed
+            enabled: New status of the tool
+        """
+        location = self._tool_bits.get(tool_name)
+        if location is not None:
+            server_name, bit = location
+            if enabled:
+                self._server_bitmap[server_name] |= bit
+            else:
+                self._server_bitmap[server_name] &= ~bit
 
     def set_enabled_tools(self, enabled_tools: Dict[str, bool]) -> None:
         """Set the enabled status of tools.
@@ -46,21 +193,19 @@ class ToolManager:
         Args:
             enabled_tools: Dictionary mapping tool names to enabled status
         """
-        self.enabled_tools = enabled_tools
+        # Keep a private copy: the bitmaps and caches only follow changes made
+        # through this class, and every change is sent back to the connector
+        self.enabled_tools = dict(enabled_tools)
+        self._rebuild_server_bitmaps()
+        self._mark_enabled_changed()
 
         # Notify server connector of tool status changes
         self._notify_server_connector_batch(enabled_tools)
 
     # Helper methods for common operations
-    def _notify_server_connector(self, tool_name: str, enabled: bool) -> None:
-        """Notify the server connector of a tool status change.
-
-        Args:
-            tool_name: Name of the tool that changed
-            enabled: New status of the tool
-        """
-        if self.server_connector:
-            self.server_connector.set_tool_status(tool_name, enabled)
+    def _mark_enabled_changed(self) -> None:
+        """Invalidate the cached enabled tool objects after a state change."""
+        self._enabled_version += 1
 
     def _notify_server_connector_batch(self, tool_status: Dict[str, bool]) -> None:
         """Notify the server connector of multiple tool status changes.
@@ -68,9 +213,13 @@ class ToolManager:
         Args:
             tool_status: Dictionary mapping tool names to enabled status
         """
-        if self.server_connector:
-            for tool_name, enabled in tool_status.items():
-                self.server_connector.set_tool_status(tool_name, enabled)
+        if self.server_connector and tool_status:
+            # Prefer a single bulk update; fall back to per-tool calls for older connectors
+            if hasattr(self.server_connector, 'set_tool_statuses'):
+                self.server_connector.set_tool_statuses(tool_status)
+            else:
+                for tool_name, enabled in tool_status.items():
+                    self.server_connector.set_tool_status(tool_name, enabled)
 
     def _clear_console(self, clear_console_func: Optional[Callable]) -> None:
         """Clear the console if a clear function is provided.
@@ -111,20 +260,40 @@ class ToolManager:
 
     def enable_all_tools(self) -> None:
         """Enable all available tools."""
-        for tool in self.available_tools:
-            self.enabled_tools[tool.name] = True
-
-        # Also update the server connector if available
-        if self.server_connector:
-            self.server_connector.enable_all_tools()
+        self._set_all_tools(True)
 
     def disable_all_tools(self) -> None:
         """Disable all available tools."""
+        self._set_all_tools(False)
+
+    def _set_all_tools(self, enabled: bool) -> None:
+        """Set every available tool to the given state.
+
+        Only the tools whose state actually changes are updated and sent to
+        the server connector, so repeating the same bulk command is a no-op.
+
+        Args:
+            enabled: Whether all tools should be enabled
+        """
         tool_status_updates = {}
 
-        for tool in self.available_tools:
-            self.enabled_tools[tool.name] = False
-            tool_status_updates[tool.name] = False
+        for server_name, server_tools in self._servers_grouped.items():
+            # Bits set in the XOR mark the tools that are not in the target state yet
+            target = self._server_mask[server_name] if enabled else 0
+            changed = self._server_bitmap.get(server_name, 0) ^ target
+            bit_index = 0
+            while changed:
+                if changed & 1:
+                    tool_status_updates[server_tools[bit_index].name] = enabled
+                changed >>= 1
+                bit_index += 1
+
+        if not tool_status_updates:
+            return
+
+        self.enabled_tools.update(tool_status_updates)
+        self._server_bitmap = dict(self._server_mask) if enabled else dict.fromkeys(self._server_mask, 0)
+        self._mark_enabled_changed()
 
         # Notify server connector of all changes at once
         self._notify_server_connector_batch(tool_status_updates)
@@ -138,10 +307,15 @@ class ToolManager:
         """
         if tool_name in self.enabled_tools:
             self.enabled_tools[tool_name] = enabled
-            self._notify_server_connector(tool_name, enabled)
+            self._set_tool_bit(tool_name, enabled)
+            self._mark_enabled_changed()
+            self._notify_server_connector_batch({tool_name: enabled})
 
     def display_available_tools(self) -> None:
         """Display available tools with their enabled/disabled status."""
+        from rich.columns import Columns
+        from rich.panel import Panel
+
         # Create a list of styled tool names
         tool_texts = []
         enabled_count = 0
@@ -154,7 +328,11 @@ class ToolManager:
 
         # Display tools in columns for better readability
         if tool_texts:
-            columns = Columns(tool_texts, equal=True, expand=True)
+            # Small lists are joined directly, skipping the column width measurement
+            if len(tool_texts) <= _MAX_TOOLS_WITHOUT_COLUMNS:
+                columns = "\n".join(tool_texts)
+            else:
+                columns = Columns(tool_texts, equal=True, expand=True)
             subtitle = f"[bold]{enabled_count}/{len(self.available_tools)} tools enabled[/bold]"
             self.console.print(Panel(columns, title="[bold]🔧 Available Tools[/bold]", subtitle=subtitle, border_style="green"))
         else:
@@ -163,10 +341,19 @@ class ToolManager:
     # These helper methods break down the select_tools method into more manageable pieces
     def _display_tool_selection_header(self) -> None:
         """Display the tool selection header."""
-        self.console.print(Panel(Text.from_markup("[bold]🔧 Tool Selection[/bold]", justify="center"),
-                                 expand=True, border_style="green"))
-        self.console.print(Panel("[bold]Available Servers and Tools[/bold]",
-                                 border_style="blue", expand=False))
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
+        # The header never changes, so build it once and reuse it on every redraw
+        if self._header_cached is None:
+            self._header_cached = Group(
+                Panel(Text.from_markup("[bold]🔧 Tool Selection[/bold]", justify="center"),
+                      expand=True, border_style="green"),
+                Panel(self.console.render_str("[bold]Available Servers and Tools[/bold]"),
+                      border_style="blue", expand=False)
+            )
+        self.console.print(self._header_cached)
 
     def _display_server_tools(self, server_name: str, server_idx: int, server_tools: List[Tool],
                              show_descriptions: bool, index_to_tool: Dict[int, Tool],
@@ -184,13 +371,53 @@ class ToolManager:
         Returns:
             Updated tool index after processing all tools
         """
-        enabled_count = sum(1 for tool in server_tools if self.enabled_tools[tool.name])
+        # Reuse the panel built for the same server and tool states, if any
+        cache_key = (server_name, server_idx, tool_index, show_descriptions,
+                     self._server_bitmap.get(server_name, 0))
+        panel = self._panel_cache.get(cache_key)
+        if panel is None:
+            panel = self._build_server_panel(server_name, server_idx, server_tools,
+                                             show_descriptions, tool_index)
+            self._panel_cache[cache_key] = panel
+            if len(self._panel_cache) > _PANEL_CACHE_SIZE:
+                self._panel_cache.popitem(last=False)
+        else:
+            self._panel_cache.move_to_end(cache_key)
+
+        # Store the mapping from display index to tool
+        for tool in server_tools:
+            index_to_tool[tool_index] = tool
+            tool_index += 1
+
+        if server_tools:
+            self.console.print(panel)
+        return tool_index
+
+    def _build_server_panel(self, server_name: str, server_idx: int, server_tools: List[Tool],
+                            show_descriptions: bool, tool_index: int) -> "Panel":
+        """Build the panel listing the tools of a specific server.
+
+        Args:
+            server_name: Name of the server
+            server_idx: Index of the server
+            server_tools: List of tools for this server
+            show_descriptions: Whether to show tool descriptions
+            tool_index: Display index of the first tool of this server
+
+        Returns:
+            Panel with the server status and its tools
+        """
+        from rich.columns import Columns
+        from rich.panel import Panel
+
+        bitmap = self._server_bitmap.get(server_name, 0)
+        enabled_count = bitmap.bit_count()
         total_count = len(server_tools)
 
         # Determine server status indicator
-        if enabled_count == total_count:
+        if bitmap == self._server_mask.get(server_name):
             server_status = self._get_status_indicator(True)  # All enabled
-        elif enabled_count == 0:
+        elif bitmap == 0:
             server_status = self._get_status_indicator(False)  # None enabled
         else:
             server_status = "[yellow]~[/yellow]"  # Some enabled
@@ -215,37 +442,27 @@ class ToolManager:
                     tool_text += description
 
                 tool_list.append(tool_text)
-
-                # Store the mapping from display index to tool
-                index_to_tool[tool_index] = tool
                 tool_index += 1
 
             # Join tool texts with newlines
             panel_content = "\n".join(tool_list)
-            self.console.print(Panel(panel_content, padding=(1,1), title=panel_title,
-                                   subtitle=panel_subtitle, border_style="blue",
-                                   title_align="left", subtitle_align="right"))
         else:
             # Original columns format for when descriptions are hidden
             # Display individual tools for this server in columns
             server_tool_texts = []
             for tool in server_tools:
                 status = self._get_status_indicator(self.enabled_tools[tool.name])
-                tool_text = f"[magenta]{tool_index}[/magenta]. {status} {tool.name}"
-
-                # Store the mapping from display index to tool
-                index_to_tool[tool_index] = tool
+                server_tool_texts.append(f"[magenta]{tool_index}[/magenta]. {status} {tool.name}")
                 tool_index += 1
 
-                server_tool_texts.append(tool_text)
+            if len(server_tool_texts) <= _MAX_TOOLS_WITHOUT_COLUMNS:
+                panel_content = "\n".join(server_tool_texts)
+            else:
+                panel_content = Columns(server_tool_texts, padding=(0, 2), equal=False, expand=False)
 
-            # Display tools in columns inside a panel if there are any
-            if server_tool_texts:
-                columns = Columns(server_tool_texts, padding=(0, 2), equal=False, expand=False)
-                self.console.print(Panel(columns, padding=(1,1), title=panel_title,
-                                     subtitle=panel_subtitle, border_style="blue",
-                                     title_align="left", subtitle_align="right"))
-        return tool_index
+        return Panel(panel_content, padding=(1,1), title=panel_title,
+                     subtitle=panel_subtitle, border_style="blue",
+                     title_align="left", subtitle_align="right")
 
     def _display_command_help(self, show_descriptions: bool) -> None:
         """Display the command help panel.
@@ -253,18 +470,32 @@ class ToolManager:
         Args:
             show_descriptions: Current state of description display
         """
-        self.console.print(Panel("[bold yellow]Commands[/bold yellow]", expand=False))
-        self.console.print("• Enter [bold magenta]numbers[/bold magenta][bold yellow] separated by commas or ranges[/bold yellow] to toggle tools (e.g. [bold]1,3,5-8[/bold])")
-        self.console.print("• Enter [bold orange3]S + number[/bold orange3] to toggle all tools in a server (e.g. [bold]S1[/bold] or [bold]s2[/bold])")
-        self.console.print("• [bold]a[/bold] or [bold]all[/bold] - Enable all tools")
-        self.console.print("• [bold]n[/bold] or [bold]none[/bold] - Disable all tools")
-        self.console.print(f"• [bold]d[/bold] or [bold]desc[/bold] - {'Hide' if show_descriptions else 'Show'} descriptions")
-        self.console.print("• [bold]j[/bold] or [bold]json[/bold] - Show detailed tool JSON schemas on enabled tools for debugging purposes")
-        self.console.print("• [bold]s[/bold] or [bold]save[/bold] - Save changes and return")
-        self.console.print("• [bold]q[/bold] or [bold]quit[/bold] - Cancel and return")
+        from rich.console import Group
+        from rich.panel import Panel
+
+        # Only the descriptions toggle line varies, so cache one help group per state.
+        # Lines are parsed into Text once so the markup is not re-parsed on every redraw.
+        help_group = self._help_cached.get(show_descriptions)
+        if help_group is None:
+            render_str = self.console.render_str
+            help_group = Group(
+                Panel(render_str("[bold yellow]Commands[/bold yellow]"), expand=False),
+                *(render_str(line) for line in (
+                    "• Enter [bold magenta]numbers[/bold magenta][bold yellow] separated by commas or ranges[/bold yellow] to toggle tools (e.g. [bold]1,3,5-8[/bold])",
+                    "• Enter [bold orange3]S + number[/bold orange3] to toggle all tools in a server (e.g. [bold]S1[/bold] or [bold]s2[/bold])",
+                    "• [bold]a[/bold] or [bold]all[/bold] - Enable all tools",
+                    "• [bold]n[/bold] or [bold]none[/bold] - Disable all tools",
+                    f"• [bold]d[/bold] or [bold]desc[/bold] - {'Hide' if show_descriptions else 'Show'} descriptions",
+                    "• [bold]j[/bold] or [bold]json[/bold] - Show detailed tool JSON schemas on enabled tools for debugging purposes",
+                    "• [bold]s[/bold] or [bold]save[/bold] - Save changes and return",
+                    "• [bold]q[/bold] or [bold]quit[/bold] - Cancel and return"
+                ))
+            )
+            self._help_cached[show_descriptions] = help_group
+        self.console.print(help_group)
 
     def _process_server_toggle(self, selection: str, sorted_servers: List[Tuple[str, List[Tool]]],
-                              clear_console_func: Optional[Callable]) -> Tuple[Optional[str], str]:
+                              clear_console_func: Optional[Callable]) -> Tuple["Text", str]:
         """Process a server toggle command.
 
         Args:
@@ -275,12 +506,14 @@ class ToolManager:
         Returns:
             Tuple of (result_message, result_style)
         """
+        from rich.text import Text
+
         server_idx = int(selection[1:]) - 1
         if 0 <= server_idx < len(sorted_servers):
             server_name, server_tools = sorted_servers[server_idx]
 
             # Check if all tools in this server are currently enabled
-            all_enabled = all(self.enabled_tools[tool.name] for tool in server_tools)
+            all_enabled = self._server_bitmap.get(server_name, 0) == self._server_mask.get(server_name)
 
             # Toggle accordingly: if all are enabled, disable all; otherwise enable all
             new_state = not all_enabled
@@ -288,23 +521,25 @@ class ToolManager:
             for tool in server_tools:
                 self.enabled_tools[tool.name] = new_state
                 tool_updates[tool.name] = new_state
+            self._server_bitmap[server_name] = self._server_mask[server_name] if new_state else 0
+            self._mark_enabled_changed()
 
             # Notify server connector of all changes
             self._notify_server_connector_batch(tool_updates)
 
             # Clear console and return result message
             self._clear_console(clear_console_func)
-            message = f"[{'green' if new_state else 'yellow'}]All tools in server '{server_name}' {'enabled' if new_state else 'disabled'}![/{'green' if new_state else 'yellow'}]"
             style = 'green' if new_state else 'yellow'
+            message = Text(f"All tools in server '{server_name}' {'enabled' if new_state else 'disabled'}!", style=style)
             return message, style
         else:
             # Clear console and return error message
             self._clear_console(clear_console_func)
-            message = f"[red]Invalid server number: S{server_idx+1}. Must be between S1 and S{len(sorted_servers)}[/red]"
+            message = Text(f"Invalid server number: S{server_idx+1}. Must be between S1 and S{len(sorted_servers)}", style="red")
             return message, 'red'
 
     def _process_tool_selection(self, selection: str, index_to_tool: Dict[int, Tool],
-                               clear_console_func: Optional[Callable]) -> Tuple[Optional[str], str]:
+                               clear_console_func: Optional[Callable]) -> Tuple["Text", str]:
         """Process tool selection command.
 
         Args:
@@ -315,85 +550,130 @@ class ToolManager:
         Returns:
             Tuple of (result_message, result_style)
         """
-        try:
-            valid_toggle = False
-
-            # Split the input by commas to handle multiple selections
-            parts = [part.strip() for part in selection.split(',') if part.strip()]
-            selections = []
-
-            for part in parts:
-                # Check if this part is a range (e.g., "5-8")
-                if '-' in part:
-                    try:
-                        start, end = map(int, part.split('-', 1))
-                        selections.extend(range(start, end + 1))
-                    except ValueError:
-                        self.console.print(f"[red]Invalid range: {part}[/red]")
-                else:
-                    # Otherwise, treat as a single number
-                    try:
-                        selections.append(int(part))
-                    except ValueError:
-                        self.console.print(f"[red]Invalid selection: {part}[/red]")
-
-            # Process the selections using our accurate mapping
-            toggled_tools_count = 0
-            invalid_indices = []
-            tool_updates = {}
+        from rich.text import Text
+
+        valid_toggle = False
+        toggled_tools_count = 0
+        invalid_indices = []
+        tool_updates = {}
+        # Display indices run from 1 to the number of tools
+        max_index = len(index_to_tool)
+
+        # Parse numbers and ranges (e.g., "5-8") in a single pass over the input
+        for token in _iter_selection(selection):
+            if isinstance(token, str):
+                invalid_indices.append(token)
+                continue
 
-            for idx in selections:
-                if idx in index_to_tool:
-                    tool = index_to_tool[idx]
-                    new_state = not self.enabled_tools[tool.name]
-                    self.enabled_tools[tool.name] = new_state
-                    tool_updates[tool.name] = new_state
-                    valid_toggle = True
-                    toggled_tools_count += 1
-                else:
-                    invalid_indices.append(idx)
+            start, end = token if isinstance(token, tuple) else (token, token)
+            if start > end:
+                continue
 
-            # Notify server connector of all changes
-            self._notify_server_connector_batch(tool_updates)
+            # Report the out-of-range parts once each, as a number or a span
+            for low, high in ((start, min(end, 0)), (max(start, max_index + 1), end)):
+                if low <= high:
+                    invalid_indices.append(low if low == high else f"{low}-{high}")
 
-            if valid_toggle:
-                result_message = f"[green]Successfully toggled {toggled_tools_count} tool{'s' if toggled_tools_count != 1 else ''}![/green]"
-                result_style = "green"
-                if invalid_indices:
-                    result_message += f"\n[yellow]Warning: Invalid indices ignored: {', '.join(map(str, invalid_indices))}[/yellow]"
-            else:
-                result_message = "[red]No valid tool numbers provided.[/red]"
-                result_style = "red"
+            # Toggle the selected tools directly using our accurate mapping,
+            # limited to the valid indices so huge ranges are never walked
+            for idx in range(max(start, 1), min(end, max_index) + 1):
+                tool = index_to_tool[idx]
+                new_state = not self.enabled_tools[tool.name]
+                self.enabled_tools[tool.name] = new_state
+                self._set_tool_bit(tool.name, new_state)
+                tool_updates[tool.name] = new_state
+                valid_toggle = True
+                toggled_tools_count += 1
 
-        except ValueError:
-            result_message = "[red]Invalid input. Please enter numbers, ranges, or server designators.[/red]"
+        if tool_updates:
+            self._mark_enabled_changed()
+
+        # Notify server connector of all changes
+        self._notify_server_connector_batch(tool_updates)
+
+        if valid_toggle:
+            result_message = Text(f"Successfully toggled {toggled_tools_count} tool{'s' if toggled_tools_count != 1 else ''}!", style="green")
+            result_style = "green"
+            if invalid_indices:
+                result_message.append(f"\nWarning: Invalid indices ignored: {', '.join(map(str, invalid_indices))}", style="yellow")
+        else:
+            result_message = Text("No valid tool numbers provided.", style="red")
             result_style = "red"
 
         self._clear_console(clear_console_func)
         return result_message, result_style
 
+    # Handlers for the named tool selection commands. Each returns the
+    # (result_message, result_style) to show, or None to leave the menu.
+    def _cmd_save(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Keep the current tool states and leave the tool selection."""
+        self._clear_console(clear_console_func)
+        return None
+
+    def _cmd_quit(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Restore the original tool states and leave the tool selection."""
+        # Tell the connector which tools were reverted
+        original_states = self._original_states
+        reverted = {name: enabled for name, enabled in original_states.items()
+                    if self.enabled_tools.get(name) != enabled}
+        self.enabled_tools = original_states
+        self._rebuild_server_bitmaps()
+        self._mark_enabled_changed()
+        self._notify_server_connector_batch(reverted)
+        self._clear_console(clear_console_func)
+        return None
+
+    def _cmd_all(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Enable all tools."""
+        from rich.text import Text
+
+        self.enable_all_tools()
+        self._clear_console(clear_console_func)
+        return Text("All tools enabled!", style="green"), "green"
+
+    def _cmd_none(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Disable all tools."""
+        from rich.text import Text
+
+        self.disable_all_tools()
+        self._clear_console(clear_console_func)
+        return Text("All tools disabled!", style="yellow"), "yellow"
+
+    def _cmd_desc(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Toggle the display of tool descriptions."""
+        from rich.text import Text
+
+        self._show_descriptions = not self._show_descriptions
+        status = "shown" if self._show_descriptions else "hidden"
+        self._clear_console(clear_console_func)
+        return Text(f"Tool descriptions {status}!", style="blue"), "blue"
+
+    def _cmd_json(self, clear_console_func: Optional[Callable]) -> Optional[Tuple[Optional["Text"], str]]:
+        """Show the JSON schemas of the enabled tools."""
+        self._clear_console(clear_console_func)
+        self.debug_tool_schemas()
+        self.console.print("\n[dim]Press Enter to continue...[/dim]")
+        input()  # Wait for user to press Enter
+        self._clear_console(clear_console_func)
+        return None, "green"
+
     def select_tools(self, clear_console_func=None) -> None:
         """Interactive interface for enabling/disabling tools.
 
         Args:
             clear_console_func: Function to clear the console (optional)
         """
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+
         # Save the original tool states in case the user cancels
-        original_states = self.enabled_tools.copy()
-        show_descriptions = False  # Default: don't show descriptions
+        self._original_states = dict(self.enabled_tools)
+        self._show_descriptions = False  # Default: don't show descriptions
         result_message = None      # Store the result message to display in a panel
         result_style = "green"     # Style for the result message panel
 
-        # Group tools by server
-        servers = {}
-        for tool in self.available_tools:
-            server_name, tool_name = tool.name.split('.', 1) if '.' in tool.name else ("default", tool.name)
-            if server_name not in servers:
-                servers[server_name] = []
-            servers[server_name].append(tool)
-
-        # Sort servers by name for consistent display
-        sorted_servers = sorted(servers.items(), key=lambda x: x[0])
+        # Tools are grouped by server once in set_available_tools
+        sorted_servers = self._sorted_servers
 
         # Clear the console to create a "new console" effect
         self._clear_console(clear_console_func)
@@ -409,7 +689,7 @@ class ToolManager:
             for server_idx, (server_name, server_tools) in enumerate(sorted_servers):
                 tool_index = self._display_server_tools(
                     server_name, server_idx, server_tools,
-                    show_descriptions, index_to_tool, tool_index
+                    self._show_descriptions, index_to_tool, tool_index
                 )
                 self.console.print()  # Add space between servers
 
@@ -419,47 +699,18 @@ class ToolManager:
                 result_message = None  # Clear the message after displaying it
 
             # Display the command help
-            self._display_command_help(show_descriptions)
+            self._display_command_help(self._show_descriptions)
 
             # Get user input
             selection = Prompt.ask("> ").strip().lower()
 
-            # Process user commands
-            if selection in ['s', 'save']:
-                self._clear_console(clear_console_func)
-                return
-
-            if selection in ['q', 'quit']:
-                # Restore original tool states
-                self.enabled_tools = original_states.copy()
-                self._clear_console(clear_console_func)
-                return
-
-            if selection in ['a', 'all']:
-                self.enable_all_tools()
-                self._clear_console(clear_console_func)
-                result_message, result_style = "[green]All tools enabled![/green]", "green"
-                continue
-
-            if selection in ['n', 'none']:
-                self.disable_all_tools()
-                self._clear_console(clear_console_func)
-                result_message, result_style = "[yellow]All tools disabled![/yellow]", "yellow"
-                continue
-
-            if selection in ['d', 'desc']:
-                show_descriptions = not show_descriptions
-                status = "shown" if show_descriptions else "hidden"
-                self._clear_console(clear_console_func)
-                result_message, result_style = f"[blue]Tool descriptions {status}![/blue]", "blue"
-                continue
-
-            if selection in ['j', 'json']:
-                self._clear_console(clear_console_func)
-                self.debug_tool_schemas()
-                self.console.print("\n[dim]Press Enter to continue...[/dim]")
-                input()  # Wait for user to press Enter
-                self._clear_console(clear_console_func)
+            # Process named commands (save, quit, all, none, desc, json)
+            command = _COMMAND_ALIASES.get(selection)
+            if command:
+                result = self._command_handlers[command](clear_console_func)
+                if result is None:
+                    return
+                result_message, result_style = result
                 continue
 
             # Check for server toggle (S1, S2, etc.)
@@ -477,10 +728,17 @@ class ToolManager:
     def get_enabled_tool_objects(self) -> List[Tool]:
         """Get a list of the Tool objects that are enabled.
 
+        The list is cached and rebuilt only after the tool states change, so
+        callers must not modify it.
+
         Returns:
             List[Tool]: List of enabled tool objects
         """
-        return [tool for tool in self.available_tools if self.enabled_tools.get(tool.name, False)]
+        if self._enabled_cache is None or self._enabled_cache_version != self._enabled_version:
+            enabled = self.enabled_tools
+            self._enabled_cache = [tool for tool in self.available_tools if enabled.get(tool.name, False)]
+            self._enabled_cache_version = self._enabled_version
+        return self._enabled_cache
 
     def set_server_connector(self, server_connector):
         """Set the server connector to notify of tool state changes.
@@ -492,6 +750,9 @@ class ToolManager:
 
     def debug_tool_schemas(self) -> None:
         """Debug method to display detailed tool schemas"""
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
         enabled_tools = self.get_enabled_tool_objects()
 
         if not enabled_tools:
@@ -2,13 +2,14 @@
 
 import os
 
+from .. import __version__
+
 # Default Claude config file location
 DEFAULT_CLAUDE_CONFIG = os.path.expanduser("~/.claude.json")
 
 # Default config directory and filename for MCP client for Ollama
+# (created on first config load/save, not at import time)
 DEFAULT_CONFIG_DIR = os.path.expanduser("~/.config/ollmcp")
-if not os.path.exists(DEFAULT_CONFIG_DIR):
-    os.makedirs(DEFAULT_CONFIG_DIR)
 
 DEFAULT_CONFIG_FILE = "config.json"
 
@@ -18,9 +19,23 @@ DEFAULT_MODEL = "qwen3:latest"
 # Default ollama lcoal url for API requests
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
 
-# URL for checking package updates on PyPI
+# URLs for checking package updates on PyPI: the PEP 691 simple index (small,
+# versions only) and the JSON API used as a fallback
+PYPI_SIMPLE_URL = "https://pypi.org/simple/mcp-client-for-ollama/"
 PYPI_PACKAGE_URL = "https://pypi.org/pypi/mcp-client-for-ollama/json"
 
+# Request headers for the PyPI endpoints above; the User-Agent identifies the client
+PYPI_USER_AGENT = f"mcp-client-for-ollama/{__version__}"
+PYPI_SIMPLE_HEADERS = {"Accept": "application/vnd.pypi.simple.v1+json", "User-Agent": PYPI_USER_AGENT}
+PYPI_HEADERS = {"Accept": "application/json", "User-Agent": PYPI_USER_AGENT}
+
+# Cached result of the last update check, and how long it stays fresh (seconds)
+VERSION_CHECK_CACHE_FILE = os.path.expanduser("~/.cache/mcp-client-for-ollama/version_check.json")
+VERSION_CHECK_TTL = 24 * 60 * 60
+
+# How long a failed connection to PyPI skips the update check (seconds)
+VERSION_CHECK_OFFLINE_TTL = 5 * 60
+
 # Thinking mode models - these models support the thinking parameter
 THINKING_MODELS = ["deepseek-r1", "qwen3"]
 
@@ -35,6 +50,7 @@ INTERACTIVE_COMMANDS = {
     'show-thinking': 'Toggle thinking visibility',
     'show-tool-execution': 'Toggle tool execution display',
     'show-metrics': 'Toggle performance metrics display',
+    'render-markdown': 'Toggle Markdown rendering',
     'clear': 'Clear conversation context',
     'context-info': 'Show context information',
     'clear-screen': 'Clear terminal screen',
@@ -2,28 +2,59 @@
 from prompt_toolkit.completion import Completer, Completion, FuzzyCompleter, WordCompleter
 from .constants import INTERACTIVE_COMMANDS
 
+# Command names and their menu labels, computed once at import
+_COMMAND_KEYS = tuple(INTERACTIVE_COMMANDS)
+_DISPLAY_FIRST = {cmd: f"▶ {cmd}" for cmd in _COMMAND_KEYS}
+_DISPLAY_REST = {cmd: f"  {cmd}" for cmd in _COMMAND_KEYS}
+
+# Fuzzy completer over all commands, shared by all instances
+_SHARED_COMPLETER = FuzzyCompleter(WordCompleter(list(_COMMAND_KEYS), ignore_case=True))
+
+# Commands bucketed by their first character, used to narrow the fuzzy candidates
+_BY_FIRST_CHAR = {}
+for _cmd in _COMMAND_KEYS:
+    _BY_FIRST_CHAR.setdefault(_cmd[0], []).append(_cmd)
+
 class FZFStyleCompleter(Completer):
     """Simple FZF-style completer with fuzzy matching."""
 
+    # Fuzzy completers per first character, shared by all instances
+    _prefix_completers = {}
+
     def __init__(self):
-        # Just wrap a WordCompleter with FuzzyCompleter
-        self.completer = FuzzyCompleter(WordCompleter(
-            list(INTERACTIVE_COMMANDS.keys()),
-            ignore_case=True
-        ))
+        # Reuse the module-level fuzzy completer instead of rebuilding it per instance
+        self.completer = _SHARED_COMPLETER
+
+    def _get_prefix_completer(self, first_char):
+        """Get the cached fuzzy completer for commands starting with first_char"""
+        completer = self._prefix_completers.get(first_char)
+        if completer is None:
+            completer = FuzzyCompleter(WordCompleter(_BY_FIRST_CHAR[first_char], ignore_case=True))
+            FZFStyleCompleter._prefix_completers[first_char] = completer
+        return completer
 
     def get_completions(self, document, complete_event):
         # Only complete if cursor is in the first word (commands only)
         text_before_cursor = document.text_before_cursor
         if " " in text_before_cursor:
           return
+
+        # Fuzzy match only the commands sharing the typed first character,
+        # falling back to all commands when none of them match
+        completions = []
+        first_char = text_before_cursor.lstrip()[:1].lower()
+        if first_char in _BY_FIRST_CHAR:
+            completions = list(self._get_prefix_completer(first_char).get_completions(document, complete_event))
+        if not completions:
+            completions = self.completer.get_completions(document, complete_event)
+
         # Get fuzzy completions
-        for i, completion in enumerate(self.completer.get_completions(document, complete_event)):
+        for i, completion in enumerate(completions):
             cmd = completion.text
             description = INTERACTIVE_COMMANDS.get(cmd, "")
 
             # Add arrow to first match
-            display = f"▶ {cmd}" if i == 0 else f"  {cmd}"
+            display = (_DISPLAY_FIRST if i == 0 else _DISPLAY_REST).get(cmd, cmd)
 
             yield Completion(
                 cmd,
@@ -4,9 +4,24 @@ This module manages HIL confirmations for tool calls, allowing users to review,
 approve, or skip tool executions before they are performed.
 """
 
+import reprlib
+
 from rich.prompt import Prompt
 from rich.console import Console
 
+# Accepted answers to the confirmation prompts
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+_EXECUTE_CHOICES = ("y", "yes", "n", "no")
+_CHOICES = _EXECUTE_CHOICES + ("disable",)
+
+# Bounded repr for argument values, so large values are never fully stringified
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 50
+_arg_repr.maxother = 50
+_arg_repr.maxdict = 3
+_arg_repr.maxlist = 3
+
 
 class HumanInTheLoopManager:
     """Manages Human-in-the-Loop confirmations for tool execution"""
@@ -21,6 +36,20 @@ class HumanInTheLoopManager:
         # Store HIL settings locally since there's no persistent config object
         self._hil_enabled = True  # Default to enabled
 
+        # Static prompt text, built once and printed in a single call each
+        self._options_markup = (
+            "[bold cyan]Options:[/bold cyan]\n"
+            "  [green]y/yes[/green] - Execute the tool call\n"
+            "  [red]n/no[/red] - Skip this tool call\n"
+            "  [yellow]disable[/yellow] - Disable HIL confirmations permanently\n"
+        )
+        self._reenable_tip = "[dim]You can re-enable this with the command: human-in-loop or hil[/dim]"
+        self._skipped_markup = (
+            "[yellow]⏭️  Tool call skipped[/yellow]\n"
+            "[dim]Tip: Use 'human-in-loop' or 'hil' to disable these confirmations permanently[/dim]"
+        )
+        self._execute_tip = "[dim]Tip: Use 'human-in-loop' or 'hil' to disable these confirmations[/dim]"
+
     def is_enabled(self) -> bool:
         """Check if HIL confirmations are enabled"""
         return self._hil_enabled
@@ -65,9 +94,7 @@ class HumanInTheLoopManager:
             self.console.print("[cyan]Arguments:[/cyan]")
             for key, value in tool_args.items():
                 # Truncate long values for display
-                display_value = str(value)
-                if len(display_value) > 50:
-                    display_value = display_value[:47] + "..."
+                display_value = _arg_repr.repr(value)
                 self.console.print(f"  • {key}: {display_value}")
         else:
             self.console.print("[cyan]Arguments:[/cyan] [dim]None[/dim]")
@@ -79,7 +106,7 @@ class HumanInTheLoopManager:
 
         choice = Prompt.ask(
             "[bold]What would you like to do?[/bold]",
-            choices=["y", "yes", "n", "no", "disable"],
+            choices=list(_CHOICES),
             default="y",
             show_choices=False
         ).lower()
@@ -88,11 +115,7 @@ class HumanInTheLoopManager:
 
     def _display_confirmation_options(self) -> None:
         """Display available confirmation options"""
-        self.console.print("[bold cyan]Options:[/bold cyan]")
-        self.console.print("  [green]y/yes[/green] - Execute the tool call")
-        self.console.print("  [red]n/no[/red] - Skip this tool call")
-        self.console.print("  [yellow]disable[/yellow] - Disable HIL confirmations permanently")
-        self.console.print()
+        self.console.print(self._options_markup)
 
     def _handle_user_choice(self, choice: str) -> bool:
         """
@@ -107,23 +130,22 @@ class HumanInTheLoopManager:
         if choice == "disable":
             self.toggle()  # Disable HIL
 
-            self.console.print("[dim]You can re-enable this with the command: human-in-loop or hil[/dim]")
+            self.console.print(self._reenable_tip)
 
             # Ask about current tool call
             execute_current = Prompt.ask(
                 "[bold]Execute this current tool call?[/bold]",
-                choices=["y", "yes", "n", "no"],
+                choices=list(_EXECUTE_CHOICES),
                 default="y"
             ).lower()
 
-            should_execute = execute_current in ["y", "yes"]
+            should_execute = execute_current in _YES
             return should_execute
 
-        elif choice in ["n", "no"]:
-            self.console.print("[yellow]⏭️  Tool call skipped[/yellow]")
-            self.console.print("[dim]Tip: Use 'human-in-loop' or 'hil' to disable these confirmations permanently[/dim]")
+        elif choice in _NO:
+            self.console.print(self._skipped_markup)
             return False
 
         else:  # y/yes
-            self.console.print("[dim]Tip: Use 'human-in-loop' or 'hil' to disable these confirmations[/dim]")
+            self.console.print(self._execute_tip)
             return True
@@ -3,8 +3,39 @@ Metrics display utilities for the MCP client for Ollama.
 
 This module provides functions for extracting and displaying performance metrics from Ollama responses.
 """
+from operator import attrgetter
+
 from rich.panel import Panel
 
+# Metric fields reported on the final chunk of an Ollama response
+_METRIC_FIELDS = (
+    'total_duration',
+    'load_duration',
+    'prompt_eval_count',
+    'prompt_eval_duration',
+    'eval_count',
+    'eval_duration',
+)
+
+# Fetches all metric fields from a chunk in a single call
+_get_metrics = attrgetter(*_METRIC_FIELDS)
+
+# Nanoseconds per second and per millisecond, for converting Ollama durations
+_NS = 1e9
+_NS_PER_MS = 1e6
+
+# Display order and format of each metric line; lines with no value are skipped
+_METRIC_LINES = (
+    ('total_duration', "[cyan]total duration:[/cyan]       {:.9f}s"),
+    ('load_duration_ms', "[cyan]load duration:[/cyan]        {:.6f}ms"),
+    ('prompt_eval_count', "[cyan]prompt eval count:[/cyan]    {} token(s)"),
+    ('prompt_eval_duration_ms', "[cyan]prompt eval duration:[/cyan] {:.6f}ms"),
+    ('eval_count', "[cyan]eval count:[/cyan]           {} token(s)"),
+    ('eval_duration', "[cyan]eval duration:[/cyan]        {:.9f}s"),
+    ('prompt_eval_rate', "[green]prompt eval rate:[/green]     {:.2f} tokens/s"),
+    ('eval_rate', "[green]eval rate:[/green]            {:.2f} tokens/s"),
+)
+
 def extract_metrics(chunk):
     """Extract metrics from an Ollama response chunk
 
@@ -14,17 +45,15 @@ def extract_metrics(chunk):
     Returns:
         dict: Dictionary containing extracted metrics, or None if no metrics available
     """
-    if not (hasattr(chunk, 'done') and chunk.done):
+    if not getattr(chunk, 'done', False):
         return None
 
-    return {
-        'total_duration': getattr(chunk, 'total_duration', None),
-        'load_duration': getattr(chunk, 'load_duration', None),
-        'prompt_eval_count': getattr(chunk, 'prompt_eval_count', None),
-        'prompt_eval_duration': getattr(chunk, 'prompt_eval_duration', None),
-        'eval_count': getattr(chunk, 'eval_count', None),
-        'eval_duration': getattr(chunk, 'eval_duration', None)
-    }
+    try:
+        values = _get_metrics(chunk)
+    except AttributeError:
+        return None
+
+    return dict(zip(_METRIC_FIELDS, values))
 
 def display_metrics(console, metrics):
     """Display performance metrics in a formatted way
@@ -36,48 +65,40 @@ def display_metrics(console, metrics):
     if not metrics:
         return
 
-    # Convert nanoseconds to seconds for durations
-    def ns_to_seconds(ns_value):
-        return ns_value / 1_000_000_000 if ns_value else 0
-
-    total_duration = ns_to_seconds(metrics.get('total_duration'))
-    load_duration = ns_to_seconds(metrics.get('load_duration'))
-    prompt_eval_duration = ns_to_seconds(metrics.get('prompt_eval_duration'))
-    eval_duration = ns_to_seconds(metrics.get('eval_duration'))
+    # Durations are reported in nanoseconds; missing ones are skipped without converting
+    total_ns = metrics.get('total_duration')
+    load_ns = metrics.get('load_duration')
+    prompt_eval_ns = metrics.get('prompt_eval_duration')
+    eval_ns = metrics.get('eval_duration')
 
     prompt_eval_count = metrics.get('prompt_eval_count', 0)
     eval_count = metrics.get('eval_count', 0)
 
+    # Values shown by each line of _METRIC_LINES, including calculated rates
+    values = {
+        'total_duration': total_ns / _NS if total_ns else None,
+        'load_duration_ms': load_ns / _NS_PER_MS if load_ns else None,
+        'prompt_eval_count': prompt_eval_count,
+        'prompt_eval_duration_ms': prompt_eval_ns / _NS_PER_MS if prompt_eval_ns else None,
+        'eval_count': eval_count,
+        'eval_duration': None,
+        'prompt_eval_rate': prompt_eval_count * _NS / prompt_eval_ns if prompt_eval_count and prompt_eval_ns else None,
+        'eval_rate': None,
+    }
+    if eval_ns:
+        eval_duration = eval_ns / _NS
+        values['eval_duration'] = eval_duration
+        if eval_count:
+            values['eval_rate'] = eval_count / eval_duration
+
     # Build metrics content
-    metrics_lines = []
-
-    # Display basic metrics
-    if total_duration > 0:
-        metrics_lines.append(f"[cyan]total duration:[/cyan]       {total_duration:.9f}s")
-    if load_duration > 0:
-        metrics_lines.append(f"[cyan]load duration:[/cyan]        {load_duration * 1000:.6f}ms")
-    if prompt_eval_count:
-        metrics_lines.append(f"[cyan]prompt eval count:[/cyan]    {prompt_eval_count} token(s)")
-    if prompt_eval_duration > 0:
-        metrics_lines.append(f"[cyan]prompt eval duration:[/cyan] {prompt_eval_duration * 1000:.6f}ms")
-    if eval_count:
-        metrics_lines.append(f"[cyan]eval count:[/cyan]           {eval_count} token(s)")
-    if eval_duration > 0:
-        metrics_lines.append(f"[cyan]eval duration:[/cyan]        {eval_duration:.9f}s")
-
-    # Calculate and display rates
-    if prompt_eval_count and prompt_eval_duration > 0:
-        prompt_eval_rate = prompt_eval_count / prompt_eval_duration
-        metrics_lines.append(f"[green]prompt eval rate:[/green]     {prompt_eval_rate:.2f} tokens/s")
-
-    if eval_count and eval_duration > 0:
-        eval_rate = eval_count / eval_duration
-        metrics_lines.append(f"[green]eval rate:[/green]            {eval_rate:.2f} tokens/s")
+    metrics_content = "\n".join(
+        template.format(values[key]) for key, template in _METRIC_LINES if values[key]
+    )
 
     # Display metrics in a panel
-    if metrics_lines:
+    if metrics_content:
         console.print()  # Add spacing before panel
-        metrics_content = "\n".join(metrics_lines)
         console.print(Panel(
             metrics_content,
             title="📊 Performance Metrics",
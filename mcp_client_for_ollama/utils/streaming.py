@@ -4,6 +4,10 @@ This file implements streaming functionality for the MCP client for Ollama.
 Classes:
     StreamingManager: Handles streaming responses from Ollama.
 """
+import asyncio
+import time
+
+from rich.console import Group
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.spinner import Spinner
@@ -11,6 +15,18 @@ from rich.table import Table
 from rich.text import Text
 from .metrics import display_metrics, extract_metrics
 
+# Minimum seconds between content re-renders (matches Live's 10 Hz refresh)
+_RENDER_INTERVAL = 0.1
+
+# Clock used to throttle re-renders
+_clock = time.monotonic
+
+# Static Markdown fragments used to assemble the content display
+_THINKING_HDR = "🤔 **Thinking:**\n\n"
+_SEP = "\n\n---\n\n"
+_ANSWER_HDR = "\n\n---\n\n**Answer:**\n\n"
+_ANSWER_PREFIX = "**Answer:**\n\n"
+
 class StreamingManager:
     """Manages streaming responses for Ollama API calls"""
 
@@ -22,37 +38,119 @@ class StreamingManager:
         """
         self.console = console
 
-    def _create_working_display(self):
-        """Create a display showing working status with spinner"""
+        # The spinner animates from Live's refresh, so one display serves every request
         table = Table.grid()
         spinner = Spinner("dots", style="cyan")
         working_text = Text("working...", style="cyan")
         header = Table.grid(padding=(0, 1))
         header.add_row(spinner, working_text)
         table.add_row(header)
-        return table
+        self._working_display = table
+
+    def _create_working_display(self):
+        """Return the display showing working status with spinner"""
+        return self._working_display
+
+    async def _animate_working(self, live):
+        """Refresh the live display so the working spinner animates until it is cancelled
+
+        Args:
+            live: Live display showing the working spinner
+        """
+        while True:
+            await asyncio.sleep(_RENDER_INTERVAL)
+            live.refresh()
 
     def _create_content_display(self, content, thinking_content="", show_thinking=True, has_tool_calls=False):
-        """Create a display for content with optional thinking section"""
+        """Create a display for content with optional thinking section
+
+        The thinking header is added here, so thinking_content holds only the model's text.
+        """
         if thinking_content and show_thinking:
             # Only add separator and Answer label if there's actual content
             if content:
-                if has_tool_calls:
-                    combined_content = thinking_content + "\n\n---\n\n" + content
-                else:
-                    combined_content = thinking_content + "\n\n---\n\n**Answer:**\n\n" + content
-            else:
-                # No content, just show thinking
-                combined_content = thinking_content
-            return Markdown(combined_content)
+                separator = _SEP if has_tool_calls else _ANSWER_HDR
+                return Markdown("".join((_THINKING_HDR, thinking_content, separator, content)))
+            # No content, just show thinking
+            return Markdown("".join((_THINKING_HDR, thinking_content)))
         else:
             # Don't add "Answer:" label when tools are being called or when content is empty
             if has_tool_calls or not content:
                 return Markdown(content)
             else:
-                return Markdown("**Answer:**\n\n" + content)
+                return Markdown("".join((_ANSWER_PREFIX, content)))
+
+    def _create_text_display(self, text_buffer, thinking_display=None):
+        """Create a display for content streamed as plain text
+
+        Args:
+            text_buffer: Text the content deltas are appended to
+            thinking_display: Rendered thinking section to show above the content, if any
+        """
+        if thinking_display is None:
+            return text_buffer
+        return Group(thinking_display, text_buffer)
+
+    async def _stream_plain(self, stream, thinking_mode=False, show_thinking=True, show_metrics=False):
+        """Write a streaming response as raw text, for consoles that are not terminals
+
+        Live updates and Markdown formatting are invisible when output is piped,
+        so content is written to the console file as it arrives.
+
+        Args:
+            stream: Async iterator of response chunks
+            thinking_mode: Whether to handle thinking mode responses
+            show_thinking: Whether to write thinking text to the output
+            show_metrics: Whether to display performance metrics when streaming completes
+
+        Returns:
+            str: Accumulated response text
+            list: Tool calls if any
+            dict: Metrics if captured, None otherwise
+        """
+        accumulated_text = ""
+        tool_calls = []
+        metrics = None
+        wrote_thinking = False
+        out = self.console.file
+
+        async for chunk in stream:
+            if getattr(chunk, 'done', False):
+                metrics = extract_metrics(chunk)
+
+            message = getattr(chunk, 'message', None)
+
+            if thinking_mode and show_thinking:
+                thinking = getattr(message, 'thinking', None)
+                if thinking:
+                    out.write(thinking)
+                    out.flush()
+                    wrote_thinking = True
+
+            content = getattr(message, 'content', None)
+            if content:
+                # Separate the answer from any thinking written before it
+                if wrote_thinking and not accumulated_text:
+                    out.write("\n\n")
+                accumulated_text += content
+                out.write(content)
+                out.flush()
 
-    async def process_streaming_response(self, stream, print_response=True, thinking_mode=False, show_thinking=True, show_metrics=False):
+            chunk_tool_calls = getattr(message, 'tool_calls', None)
+            if chunk_tool_calls:
+                tool_calls.extend(chunk_tool_calls)
+
+        # End the streamed line before anything else is printed
+        if accumulated_text or wrote_thinking:
+            out.write("\n")
+            out.flush()
+
+        if show_metrics and metrics:
+            display_metrics(self.console, metrics)
+
+        return accumulated_text, tool_calls, metrics
+
+    async def process_streaming_response(self, stream, print_response=True, thinking_mode=False, show_thinking=True, show_metrics=False, markdown=True):
         """Process a streaming response from Ollama with status spinner and content updates
 
         Args:
@@ -61,6 +159,9 @@ class StreamingManager:
             thinking_mode: Whether to handle thinking mode responses
             show_thinking: Whether to keep thinking text visible in final output
             show_metrics: Whether to display performance metrics when streaming completes
+            markdown: Whether to render content as Markdown. When False, content deltas are
+                appended to a plain Text buffer instead of re-parsing the whole answer on each
+                update, so no bold/code formatting but rendering cost stays linear in output length
 
         Returns:
             str: Accumulated response text
@@ -72,69 +173,136 @@ class StreamingManager:
         tool_calls = []
         showing_working = True  # Track if we're still showing the working display
         metrics = None  # Store metrics from final chunk
+        next_render = 0.0  # Earliest time the content display may be rebuilt
+        flush_handle = None  # Scheduled redraw of content received since the last rebuild
+        text_buffer = Text()  # Content rendered without Markdown when markdown=False
+        thinking_display = None  # Thinking section shown above text_buffer
+
+        if print_response and not self.console.is_terminal:
+            return await self._stream_plain(stream, thinking_mode, show_thinking, show_metrics)
 
         if print_response:
-            with Live(console=self.console, refresh_per_second=10, vertical_overflow='visible') as live:
-                # Start with working display
-                live.update(self._create_working_display())
-
-                async for chunk in stream:
-                    # Capture metrics when chunk is done
-                    extracted_metrics = extract_metrics(chunk)
-                    if extracted_metrics:
-                        metrics = extracted_metrics
-
-                    # Handle thinking content
-                    if (thinking_mode and hasattr(chunk, 'message') and
-                        hasattr(chunk.message, 'thinking') and chunk.message.thinking):
-
-                        if not thinking_content:
-                            thinking_content = "🤔 **Thinking:**\n\n"
-                        thinking_content += chunk.message.thinking
-
-                        # Hide working display and show thinking content
-                        if showing_working:
-                            showing_working = False
+            # Redraw only when the display changes instead of on a 10 Hz background thread
+            with Live(console=self.console, auto_refresh=False, vertical_overflow='visible') as live:
+                # Start with working display, animated until the first output replaces it
+                live.update(self._create_working_display(), refresh=True)
 
-                        display = self._create_content_display(
-                            accumulated_text, thinking_content, show_thinking=True, has_tool_calls=False
+                def current_display():
+                    """Build the display for everything received so far"""
+                    if markdown or not accumulated_text or tool_calls:
+                        return self._create_content_display(
+                            accumulated_text, thinking_content, show_thinking or not accumulated_text,
+                            has_tool_calls=bool(tool_calls)
                         )
-                        live.update(display)
+                    return self._create_text_display(text_buffer, thinking_display)
 
-                    # Handle regular content
-                    if (hasattr(chunk, 'message') and hasattr(chunk.message, 'content') and
-                        chunk.message.content):
+                def flush():
+                    """Draw content held back by the throttle, even if no further chunk arrives"""
+                    nonlocal flush_handle, next_render
+                    flush_handle = None
+                    live.update(current_display(), refresh=True)
+                    next_render = _clock() + _RENDER_INTERVAL
 
-                        accumulated_text += chunk.message.content
+                loop = asyncio.get_running_loop()
+                spinner_task = asyncio.create_task(self._animate_working(live))
+                try:
+                    async for chunk in stream:
+                        # Capture metrics when chunk is done
+                        if getattr(chunk, 'done', False):
+                            metrics = extract_metrics(chunk)
 
-                        # Hide working display and show content
-                        if showing_working:
+                        # Look up the message fields once per chunk
+                        message = getattr(chunk, 'message', None)
+                        thinking = getattr(message, 'thinking', None) if thinking_mode else None
+                        content = getattr(message, 'content', None)
+                        chunk_tool_calls = getattr(message, 'tool_calls', None)
+
+                        # Handle thinking content
+                        if thinking:
+                            thinking_content += thinking
+
+                            # Hide working display and show thinking content
+                            if showing_working:
+                                showing_working = False
+
+                            # Rebuild the Markdown at most once per refresh interval
+                            now = _clock()
+                            if now >= next_render:
+                                display = self._create_content_display(
+                                    accumulated_text, thinking_content, show_thinking=True, has_tool_calls=False
+                                )
+                                live.update(display, refresh=True)
+                                next_render = now + _RENDER_INTERVAL
+                                if flush_handle is not None:
+                                    flush_handle.cancel()
+                                    flush_handle = None
+                            elif flush_handle is None:
+                                flush_handle = loop.call_later(next_render - now, flush)
+
+                        # Handle regular content
+                        if content:
+                            if not markdown:
+                                # Render the thinking section once, when the answer starts
+                                if not accumulated_text and thinking_content and show_thinking:
+                                    thinking_display = Markdown("".join((_THINKING_HDR, thinking_content, _ANSWER_HDR)))
+                                text_buffer.append(content)
+                            accumulated_text += content
+
+                            # Hide working display and show content
+                            if showing_working:
+                                showing_working = False
+
+                            # Update display based on thinking mode, at most once per refresh interval
+                            now = _clock()
+                            if now >= next_render:
+                                if markdown:
+                                    display = self._create_content_display(
+                                        accumulated_text, thinking_content, show_thinking, has_tool_calls=False
+                                    )
+                                else:
+                                    display = self._create_text_display(text_buffer, thinking_display)
+                                live.update(display, refresh=True)
+                                next_render = now + _RENDER_INTERVAL
+                                if flush_handle is not None:
+                                    flush_handle.cancel()
+                                    flush_handle = None
+                            elif flush_handle is None:
+                                flush_handle = loop.call_later(next_render - now, flush)
+
+                        # Handle tool calls
+                        if chunk_tool_calls:
+                            # Hide working display and show final content if any before tool calls
                             showing_working = False
 
-                        # Update display based on thinking mode
-                        display = self._create_content_display(
-                            accumulated_text, thinking_content, show_thinking, has_tool_calls=False
-                        )
-                        live.update(display)
-
-                    # Handle tool calls
-                    if (hasattr(chunk, 'message') and hasattr(chunk.message, 'tool_calls') and
-                        chunk.message.tool_calls):
-                        # Hide working display and show final content if any before tool calls
-                        showing_working = False
-
-                        for tool in chunk.message.tool_calls:
-                            tool_calls.append(tool)
-
-                        # Show final content display if we have any accumulated text
-                        if accumulated_text or thinking_content:
-                            display = self._create_content_display(
-                                accumulated_text, thinking_content, show_thinking, has_tool_calls=True
-                            )
-                            live.update(display)
-                        else:
-                            # Clear the working display by showing empty content
-                            live.update(Markdown(""))
+                            tool_calls.extend(chunk_tool_calls)
+
+                            # Show final content display if we have any accumulated text
+                            if accumulated_text or thinking_content:
+                                display = self._create_content_display(
+                                    accumulated_text, thinking_content, show_thinking, has_tool_calls=True
+                                )
+                                live.update(display, refresh=True)
+                            else:
+                                # Clear the working display by showing empty content
+                                live.update(Markdown(""), refresh=True)
+                            if flush_handle is not None:
+                                flush_handle.cancel()
+                                flush_handle = None
+
+                        # Stop animating the spinner once it has been replaced
+                        if spinner_task is not None and not showing_working:
+                            spinner_task.cancel()
+                            spinner_task = None
+
+                    # Flush content that arrived after the last throttled render
+                    if flush_handle is not None:
+                        flush_handle.cancel()
+                        flush()
+                finally:
+                    if spinner_task is not None:
+                        spinner_task.cancel()
+                    if flush_handle is not None:
+                        flush_handle.cancel()
 
             # Add spacing after streaming completes only if we showed content and no tool calls
             if not showing_working and not tool_calls:
@@ -147,21 +315,23 @@ class StreamingManager:
             # Silent processing without display
             async for chunk in stream:
                 # Capture metrics when chunk is done
-                extracted_metrics = extract_metrics(chunk)
-                if extracted_metrics:
-                    metrics = extracted_metrics
-
-                if (thinking_mode and hasattr(chunk, 'message') and
-                    hasattr(chunk.message, 'thinking') and chunk.message.thinking):
-                    thinking_content += chunk.message.thinking
-
-                if (hasattr(chunk, 'message') and hasattr(chunk.message, 'content') and
-                    chunk.message.content):
-                    accumulated_text += chunk.message.content
-
-                if (hasattr(chunk, 'message') and hasattr(chunk.message, 'tool_calls') and
-                    chunk.message.tool_calls):
-                    for tool in chunk.message.tool_calls:
-                        tool_calls.append(tool)
+                if getattr(chunk, 'done', False):
+                    metrics = extract_metrics(chunk)
+
+                # Look up the message fields once per chunk
+                message = getattr(chunk, 'message', None)
+
+                if thinking_mode:
+                    thinking = getattr(message, 'thinking', None)
+                    if thinking:
+                        thinking_content += thinking
+
+                content = getattr(message, 'content', None)
+                if content:
+                    accumulated_text += content
+
+                chunk_tool_calls = getattr(message, 'tool_calls', None)
+                if chunk_tool_calls:
+                    tool_calls.extend(chunk_tool_calls)
 
         return accumulated_text, tool_calls, metrics
@@ -4,11 +4,37 @@ Handles the formatting and display of tool calls and responses
 """
 
 import json
+from pygments.lexers.data import JsonLexer
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.text import Text
-from typing import Any
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as JSON indented by two spaces, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. non-str keys, huge ints)
+            pass
+    # Keep non-ASCII text readable, as orjson does
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# JSON parser for string data, orjson when available
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Lexer and theme shared by every JSON panel, so Pygments state is not rebuilt per call
+_JSON_LEXER = JsonLexer()
+_JSON_THEME = Syntax.get_theme("monokai")
 
 
 class ToolDisplayManager:
@@ -16,25 +42,37 @@ class ToolDisplayManager:
 
     def __init__(self, console: Console):
         self.console = console
+        # Arguments of the last displayed execution and their formatted output,
+        # overwritten on each execution so a failed tool call leaves nothing behind
+        self._last_args: Optional[Tuple[Any, Syntax]] = None
+
+    def _format_args(self, tool_args: Any) -> Syntax:
+        """Format tool arguments, reusing the execution panel's output if available
+
+        Args:
+            tool_args: Arguments passed to the tool (always JSON-serializable)
+
+        Returns:
+            A Syntax object for JSON display
+        """
+        last = self._last_args
+        if last is not None and last[0] is tool_args:
+            return last[1]
+        return self._format_json_obj(tool_args)
 
-    def _format_json(self, data: Any) -> Syntax:
-        """Format data as JSON with syntax highlighting
+    def _format_json_obj(self, obj: Any) -> Syntax:
+        """Format an already-parsed JSON value with syntax highlighting
 
         Args:
-            data: The data to format (always JSON-serializable)
+            obj: The parsed value to format (dict, list or other JSON-serializable data)
 
         Returns:
             A Syntax object for JSON display
         """
-        if isinstance(data, dict) or isinstance(data, list):
-            formatted_json = json.dumps(data, indent=2)
-        else:
-            # Parse as JSON if it's a string
-            parsed_data = json.loads(str(data))
-            formatted_json = json.dumps(parsed_data, indent=2)
+        formatted_json = _dumps(obj)
 
         # Use Rich Syntax with Monokai theme for JSON
-        return Syntax(formatted_json, "json", theme="monokai", line_numbers=False)
+        return Syntax(formatted_json, _JSON_LEXER, theme=_JSON_THEME, line_numbers=False)
 
     def display_tool_execution(self, tool_name: str, tool_args: Any, show: bool = True) -> None:
         """Display the tool execution panel with arguments
@@ -47,7 +85,8 @@ class ToolDisplayManager:
         if not show:
             return
 
-        args_display = self._format_json(tool_args)
+        args_display = self._format_json_obj(tool_args)
+        self._last_args = (tool_args, args_display)
 
         # Create the tool execution panel with JSON syntax highlighting
         panel_content = Text.from_markup("[bold]Arguments:[/bold]\n\n")
@@ -74,12 +113,12 @@ class ToolDisplayManager:
         if not show:
             return
 
-        args_display = self._format_json(tool_args)
+        args_display = self._format_args(tool_args)
 
         # Try to format response as JSON if possible, otherwise display as text
         try:
-            response_data = json.loads(tool_response)
-            response_display = self._format_json(response_data)
+            response_data = _loads(tool_response)
+            response_display = self._format_json_obj(response_data)
 
             # Both args and response are formatted - create layout with syntax highlighting
             header_text = Text.from_markup("[bold]Arguments:[/bold]\n\n")
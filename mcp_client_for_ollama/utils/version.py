@@ -1,34 +1,244 @@
 """Version handling utilities for MCP Client for Ollama."""
 
+import os
 import re
 import json
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.request
 from mcp_client_for_ollama import __version__
-from .constants import PYPI_PACKAGE_URL
+from .constants import (
+    PYPI_HEADERS,
+    PYPI_PACKAGE_URL,
+    PYPI_SIMPLE_HEADERS,
+    PYPI_SIMPLE_URL,
+    VERSION_CHECK_CACHE_FILE,
+    VERSION_CHECK_OFFLINE_TTL,
+    VERSION_CHECK_TTL,
+)
+
+# Numeric components of a version string, for versions that are not plain X.Y.Z
+_VERSION_RE = re.compile(r'\d+', re.ASCII)
+
+# Version part of a wheel or sdist file name, e.g. mcp_client_for_ollama-0.16.0-py3-none-any.whl
+_FILE_VERSION_RE = re.compile(r'-(\d[^-]*?)(?:-[^-]+-[^-]+-[^-]+\.whl|\.tar\.gz|\.zip)$', re.ASCII)
+
+# The "version" field of the PyPI "info" object, searched for in the raw response body
+_INFO_VERSION_RE = re.compile(rb'"version"\s*:\s*"([^"]+)"')
+
+
+def _parse_version(version_str):
+    """Parse a version string into a tuple of integers for comparison."""
+    # Plain dotted versions (e.g. 0.1.11) need no regex; isdigit alone also accepts e.g. '²'
+    parts = version_str.split('.')
+    if all(part.isascii() and part.isdigit() for part in parts):
+        return tuple(map(int, parts))
+    return tuple(map(int, _VERSION_RE.findall(version_str)))
+
+
+# Installed version, parsed once at import
+_CURRENT_PARSED = _parse_version(__version__)
+
+# Last (latest_version, result) computed by check_for_updates
+_last_check = None
+
+
+def _extract_latest_version(body):
+    """Extract info.version from a PyPI JSON response without decoding all releases.
+
+    Args:
+        body: Raw response body from the PyPI JSON API
+
+    Returns:
+        str: The latest version published on PyPI
+    """
+    info_start = body.find(b'"info"')
+    if info_start != -1:
+        match = _INFO_VERSION_RE.search(body, info_start)
+        if match:
+            return match.group(1).decode()
+    # Unexpected layout, fall back to a full parse
+    return json.loads(body)["info"]["version"]
+
+
+def _latest_from_simple_index(body):
+    """Pick the newest final release from a PEP 691 simple index JSON response.
+
+    Versions are taken from the files that are not yanked, since the
+    top-level "versions" list still includes yanked releases.
+
+    Args:
+        body: Raw response body from the simple index
+
+    Returns:
+        str: The highest plain X.Y.Z version with at least one non-yanked file
+    """
+    releases = set()
+    for file in json.loads(body)["files"]:
+        if file.get("yanked"):
+            continue
+        match = _FILE_VERSION_RE.search(file["filename"])
+        # Skip pre-releases and other non-numeric versions, as the JSON API's info.version does
+        if match and all(part.isascii() and part.isdigit() for part in match.group(1).split('.')):
+            releases.add(match.group(1))
+    return max(releases, key=_parse_version)
+
+
+def _read_cache():
+    """Read the cached update check result.
+
+    Returns:
+        dict: The cached {latest, etags, timestamp} entry, or an empty dict if unavailable
+    """
+    try:
+        with open(VERSION_CHECK_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache):
+    """Store an entry in the update check cache.
+
+    The entry is written to a temporary file that then replaces the cache,
+    so a concurrent _read_cache never sees a partly written file.
+    """
+    cache_dir = os.path.dirname(VERSION_CHECK_CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, VERSION_CHECK_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Caching is best effort; the next run simply checks again
+        pass
+
+
+def _fetch_latest_version(cache):
+    """Fetch the latest version from PyPI, revalidating the cached one with its ETag.
+
+    The small simple index is tried first; the JSON API is used if that fails
+    (e.g. a mirror without PEP 691 support).
+
+    Args:
+        cache: The cached update check entry (may be empty)
+
+    Returns:
+        str: The latest version published on PyPI
+    """
+    try:
+        return _fetch_from(PYPI_SIMPLE_URL, PYPI_SIMPLE_HEADERS, _latest_from_simple_index, cache)
+    except Exception as e:
+        # A connection failure would fail the JSON API the same way
+        if isinstance(e, OSError) and not isinstance(e, urllib.error.HTTPError):
+            raise
+        return _fetch_from(PYPI_PACKAGE_URL, PYPI_HEADERS, _extract_latest_version, cache)
+
+
+def _fetch_from(url, headers, parse, cache):
+    """Fetch the latest version from one PyPI endpoint and store it in the cache.
+
+    Args:
+        url: Endpoint to request
+        headers: Request headers for the endpoint (not modified)
+        parse: Function extracting the latest version from the response body
+        cache: The cached update check entry (may be empty)
+
+    Returns:
+        str: The latest version published on PyPI
+    """
+    # ETags are per endpoint, so each URL revalidates only with its own
+    etags = cache.get("etags")
+    if not isinstance(etags, dict):
+        etags = {}
+    cached_etag = etags.get(url)
+
+    # Only revalidation needs its own headers; otherwise the shared constant is used as is
+    if cached_etag and cache.get("latest"):
+        headers = dict(headers, **{"If-None-Match": cached_etag})
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            latest_version = parse(response.read())
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        # 304 Not Modified: the cached version is still current
+        if e.code != 304:
+            raise
+        latest_version = cache["latest"]
+        etag = cached_etag
+
+    _write_cache({"latest": latest_version, "etags": dict(etags, **{url: etag}), "timestamp": time.time()})
+    return latest_version
+
+
+def _refresh_cache():
+    """Refresh the update check cache from PyPI if it is missing or stale."""
+    try:
+        cache = _read_cache()
+        now = time.time()
+        if cache.get("latest") and now - cache.get("timestamp", 0) < VERSION_CHECK_TTL:
+            return
+        # A recent failed request means we are likely still offline
+        if now - cache.get("offline_timestamp", 0) < VERSION_CHECK_OFFLINE_TTL:
+            return
+        try:
+            _fetch_latest_version(cache)
+        except OSError:
+            # URLError and timeouts: skip the check for a while instead of retrying every start
+            _write_cache(dict(cache, offline_timestamp=now))
+    except Exception:
+        # The check is retried on the next start
+        pass
+
+
+def start_update_check():
+    """Refresh the update check cache in a background daemon thread.
+
+    Network latency never delays startup; check_for_updates reports the
+    cached result, so a newly published version shows on a later run.
+
+    Returns:
+        threading.Thread: The started thread
+    """
+    thread = threading.Thread(target=_refresh_cache, name="ollmcp-update-check", daemon=True)
+    thread.start()
+    return thread
+
 
 def check_for_updates():
     """Check if a newer version of the package is available on PyPI.
 
+    Only the on-disk cache is read; it is kept up to date by start_update_check,
+    which asks PyPI at most once a day and revalidates with the cached ETag.
+
     Returns:
         Tuple[bool, str, str]: (update_available, current_version, latest_version)
     """
+    global _last_check
     current_version = __version__
 
     try:
-        with urllib.request.urlopen(PYPI_PACKAGE_URL, timeout=5) as response:
-            data = json.load(response)
-            latest_version = data.get("info", {}).get("version", current_version)
-
-            # Compare versions (treating them as tuples of integers)
-            def parse_version(version_str):
-                # Extract numbers from version string (handles formats like 0.1.11)
-                return tuple(map(int, re.findall(r'\d+', version_str)))
+        latest_version = _read_cache().get("latest") or current_version
 
-            current_parsed = parse_version(current_version)
-            latest_parsed = parse_version(latest_version)
+        # Reuse the previous result while the cached latest version is unchanged
+        if _last_check is not None and _last_check[0] == latest_version:
+            return _last_check[1]
 
-            update_available = latest_parsed > current_parsed
-            return update_available, current_version, latest_version
+        # Compare versions (treating them as tuples of integers)
+        update_available = _parse_version(latest_version) > _CURRENT_PARSED
+        result = (update_available, current_version, latest_version)
+        _last_check = (latest_version, result)
+        return result
 
     except Exception:
         # Return no update available on error
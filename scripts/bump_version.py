@@ -9,8 +9,20 @@ ensuring they stay in sync.
 import argparse
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, fall back to the version regex
+    tomllib = None
+
+# Version patterns, compiled once and reused for every file. PYPROJECT_UPDATE_RE
+# matches both the version line and the CLI package's pin on the main package.
+PYPROJECT_VERSION_RE = re.compile(r'version\s*=\s*"([^"]+)"')
+PYPROJECT_UPDATE_RE = re.compile(r'(version\s*=\s*)"([^"]+)"|("mcp-client-for-ollama==)([^"]+)"')
+INIT_VERSION_RE = re.compile(r'(__version__\s*=\s*)"([^"]+)"')
+
 
 def regenerate_uvlock(directory):
     """Regenerate the uv.lock file in the specified directory."""
@@ -22,16 +34,22 @@ def regenerate_uvlock(directory):
         print(f"Warning: Failed to regenerate uv.lock in {directory}")
         return False
 
-def check_version_consistency(files):
-    """Check if versions are consistent across all files."""
+def check_version_consistency(files, contents=None):
+    """Check if versions are consistent across all files.
+
+    File contents read here are stored in ``contents`` (keyed by path) when given,
+    so the update step can reuse them instead of reading each file again.
+    """
     versions = {}
-    
+    if contents is None:
+        contents = {}
     
     # Check pyproject.toml files
     for name, file_path in files.items():
         if "pyproject" in name and file_path.exists():
             try:
-                versions[str(file_path)] = read_version(file_path)
+                content = contents[file_path] = file_path.read_text()
+                versions[str(file_path)] = read_version(file_path, content)
             except ValueError:
                 versions[str(file_path)] = "VERSION NOT FOUND"
     
@@ -39,11 +57,10 @@ def check_version_consistency(files):
     for name, file_path in files.items():
         if "init" in name and file_path.exists():
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
+                content = contents[file_path] = file_path.read_text()
+                match = INIT_VERSION_RE.search(content)
                 if match:
-                    versions[str(file_path)] = match.group(1)
+                    versions[str(file_path)] = match.group(2)
                 else:
                     versions[str(file_path)] = "VERSION NOT FOUND"
             except Exception:
@@ -55,19 +72,32 @@ def check_version_consistency(files):
     
     return unique_versions, versions
 
-def read_version(file_path):
-    """Read the current version from a pyproject.toml file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
+def read_version(file_path, content=None):
+    """Read the current version from a pyproject.toml file, or from its already-read content."""
+    if content is None:
+        content = Path(file_path).read_text()
+
+    if tomllib is not None:
+        try:
+            return tomllib.loads(content)["project"]["version"]
+        except (tomllib.TOMLDecodeError, KeyError, TypeError):
+            raise ValueError(f"Could not find version in {file_path}")
+
     # Use regex to find the version line
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
+    match = PYPROJECT_VERSION_RE.search(content)
     if match:
         return match.group(1)
     else:
         raise ValueError(f"Could not find version in {file_path}")
 
 
+def is_valid_version(version):
+    """Check that a version has the X.Y.Z format with ASCII numeric parts."""
+    parts = version.split('.')
+    # isdigit alone also accepts non-ASCII digits such as "²", which int() rejects
+    return len(parts) == 3 and all(part.isascii() and part.isdigit() for part in parts)
+
+
 def bump_version(version, bump_type):
     """Bump a version number based on semantic versioning."""
     major, minor, patch = map(int, version.split('.'))
@@ -85,35 +115,44 @@ def bump_version(version, bump_type):
     return f"{major}.{minor}.{patch}"
 
 
-def update_version_in_file(file_path, new_version):
-    """Update the version in a pyproject.toml file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
+def write_if_changed(file_path, content, updated_content):
+    """Write updated content to a file, skipping the write when nothing changed.
+
+    Returns:
+        bool: Whether the file was written
+    """
+    if updated_content == content:
+        return False
+    Path(file_path).write_text(updated_content)
+    return True
+
+
+def update_version_in_file(file_path, new_version, content=None):
+    """Update the version in a pyproject.toml file, optionally from its already-read content."""
+    if content is None:
+        content = Path(file_path).read_text()
         
-    # Replace version in the version line - using a lambda for safe replacement
-    version_pattern = re.compile(r'(version\s*=\s*)"([^"]+)"')
-    updated_content = version_pattern.sub(lambda m: f'{m.group(1)}"{new_version}"', content)
-    
-    # Also update any dependency on the main package (for the CLI package)
-    dep_pattern = re.compile(r'("mcp-client-for-ollama==)([^"]+)"')
-    updated_content = dep_pattern.sub(lambda m: f'{m.group(1)}{new_version}"', updated_content)
+    # Replace version in the version line and any dependency on the main package
+    # (for the CLI package) - using a lambda for safe replacement
+    updated_content = PYPROJECT_UPDATE_RE.sub(
+        lambda m: f'{m.group(1)}"{new_version}"' if m.group(1) else f'{m.group(3)}{new_version}"',
+        content
+    )
     
-    with open(file_path, 'w') as f:
-        f.write(updated_content)
+    return write_if_changed(file_path, content, updated_content)
 
 
-def update_version_in_init(init_path, new_version):
-    """Update the __version__ in __init__.py files."""
+def update_version_in_init(init_path, new_version, content=None):
+    """Update the __version__ in __init__.py files, optionally from already-read content."""
     if os.path.exists(init_path):
-        with open(init_path, 'r') as f:
-            content = f.read()
+        if content is None:
+            content = Path(init_path).read_text()
         
         # Replace version in __version__ = "x.y.z" - using lambda for safe replacement
-        version_pattern = re.compile(r'(__version__\s*=\s*)"([^"]+)"')
-        updated_content = version_pattern.sub(lambda m: f'{m.group(1)}"{new_version}"', content)
+        updated_content = INIT_VERSION_RE.sub(lambda m: f'{m.group(1)}"{new_version}"', content)
         
-        with open(init_path, 'w') as f:
-            f.write(updated_content)
+        return write_if_changed(init_path, content, updated_content)
+    return False
 
 
 def main():
@@ -152,7 +191,8 @@ def main():
 
      # Calculate and check versions for consistency
     print("Checking version consistency across files...")
-    unique_versions, all_versions = check_version_consistency(files)
+    contents = {}
+    unique_versions, all_versions = check_version_consistency(files, contents)
     
     if len(unique_versions) > 1:
         print("\nWARNING: Version inconsistency detected!")
@@ -167,12 +207,12 @@ def main():
     else:
         print("\nAll files have consistent versions.")        
 
-    # Read current version from main package
-    main_pyproject = repo_root / "pyproject.toml"
-
-    
-    # Read current version
-    current_version = read_version(main_pyproject)
+    # Current version of the main package, as read by the consistency check
+    main_pyproject = files["main_pyproject"]
+    current_version = all_versions.get(str(main_pyproject))
+    if current_version in (None, "VERSION NOT FOUND"):
+        # Not found above; read it directly so the usual error is reported
+        current_version = read_version(main_pyproject, contents.get(main_pyproject))
     print(f"Current version: {current_version}")
     
     # Calculate new version
@@ -181,7 +221,7 @@ def main():
             parser.error("--version is required when using 'custom' bump type")
         new_version = args.version
         # Check if version is valid
-        if not re.match(r'^\d+\.\d+\.\d+$', new_version):
+        if not is_valid_version(new_version):
             parser.error(f"Invalid version format: {new_version}. Expected format: X.Y.Z")
     else:
         new_version = bump_version(current_version, args.bump_type)
@@ -194,19 +234,25 @@ def main():
     
     # Update versions
     print(f"Updating main package version in {main_pyproject}")
-    update_version_in_file(main_pyproject, new_version)
-    
     print(f"Updating CLI package version in {files['cli_pyproject']}")
-    update_version_in_file(files['cli_pyproject'], new_version)
-    
-    # Update __version__ in __init__.py files if they exist
     print(f"Checking for __init__.py files...")
-    update_version_in_init(files['main_init'], new_version)
-    update_version_in_init(files['cli_init'], new_version)
 
-    # Regenerate uv.lock files
+    # Reuse the contents read by the consistency check; unchanged files are not rewritten
+    update_version_in_file(main_pyproject, new_version, contents.get(main_pyproject))
+    update_version_in_file(files['cli_pyproject'], new_version, contents.get(files['cli_pyproject']))
+
+    # Update __version__ in __init__.py files if they exist
+    for init_path in (files['main_init'], files['cli_init']):
+        update_version_in_init(init_path, new_version, contents.get(init_path))
+
+    # Regenerate uv.lock files; each lock is an independent subprocess, so run them concurrently.
+    # The CLI package is only locked if it already has its own lockfile.
     print("Regenerating uv.lock files...")
-    regenerate_uvlock(repo_root)
+    lock_dirs = [repo_root]
+    if (repo_root / "cli-package" / "uv.lock").exists():
+        lock_dirs.append(repo_root / "cli-package")
+    with ThreadPoolExecutor(max_workers=len(lock_dirs)) as executor:
+        list(executor.map(regenerate_uvlock, lock_dirs))
     
     print(f"Version bump complete! {current_version} -> {new_version}")
     print("\nNext steps:")
@@ -0,0 +1,83 @@
+"""Test the release version bump script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+spec = importlib.util.spec_from_file_location("bump_version", SCRIPT)
+bump_version = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bump_version)
+
+CLI_PYPROJECT = '''[project]
+name = "ollmcp"
+version = "0.16.0"
+requires-python = ">=3.10"
+dependencies = [
+    "mcp-client-for-ollama==0.16.0"
+]
+'''
+
+
+@pytest.mark.parametrize("version,valid", [
+    ("1.2.3", True),
+    ("10.0.123", True),
+    ("1.2", False),
+    ("1.2.3.4", False),
+    ("1.2.x", False),
+    ("1.2.", False),
+    # Non-ASCII digits pass str.isdigit() but are not valid version numbers
+    ("1.2.³", False),
+    ("１.2.3", False),
+])
+def test_is_valid_version(version, valid):
+    """Test that only X.Y.Z versions with ASCII digits are accepted."""
+    assert bump_version.is_valid_version(version) is valid
+
+
+@pytest.mark.parametrize("bump_type,expected", [
+    ("patch", "1.2.4"),
+    ("minor", "1.3.0"),
+    ("major", "2.0.0"),
+])
+def test_bump_version(bump_type, expected):
+    """Test that each bump type resets the lower version parts."""
+    assert bump_version.bump_version("1.2.3", bump_type) == expected
+
+
+def test_pyproject_version_and_pin_are_updated(tmp_path):
+    """Test that the version line and the pin on the main package are both replaced."""
+    path = tmp_path / "pyproject.toml"
+    path.write_text(CLI_PYPROJECT)
+
+    assert bump_version.read_version(path) == "0.16.0"
+    assert bump_version.update_version_in_file(path, "0.17.0") is True
+
+    content = path.read_text()
+    assert 'version = "0.17.0"' in content
+    assert '"mcp-client-for-ollama==0.17.0"' in content
+    assert 'requires-python = ">=3.10"' in content
+    assert bump_version.read_version(path) == "0.17.0"
+
+
+def test_init_version_is_updated(tmp_path):
+    """Test that __version__ is replaced and unchanged files are not rewritten."""
+    path = tmp_path / "__init__.py"
+    path.write_text('"""Package."""\n\n__version__ = "0.16.0"\n')
+
+    assert bump_version.update_version_in_init(path, "0.17.0") is True
+    assert path.read_text() == '"""Package."""\n\n__version__ = "0.17.0"\n'
+    assert bump_version.update_version_in_init(path, "0.17.0") is False
+    assert bump_version.update_version_in_init(tmp_path / "missing.py", "0.17.0") is False
+
+
+def test_read_version_regex_fallback(monkeypatch, tmp_path):
+    """Test that the version is found without tomllib (Python 3.10)."""
+    monkeypatch.setattr(bump_version, "tomllib", None)
+    path = tmp_path / "pyproject.toml"
+    path.write_text(CLI_PYPROJECT)
+
+    assert bump_version.read_version(path) == "0.16.0"
+    with pytest.raises(ValueError):
+        bump_version.read_version(path, "[project]\nname = \"x\"\n")
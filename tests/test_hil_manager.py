@@ -0,0 +1,41 @@
+"""Test Human-in-the-Loop confirmations."""
+
+import asyncio
+import io
+
+from rich.console import Console
+
+from mcp_client_for_ollama.utils.hil_manager import HumanInTheLoopManager
+
+
+def make_hil():
+    """Create a HumanInTheLoopManager that writes to an in-memory console."""
+    return HumanInTheLoopManager(Console(file=io.StringIO(), width=200))
+
+
+def test_confirmation_truncates_large_arguments(monkeypatch):
+    """Test that long argument values are shown in bounded form."""
+    hil = make_hil()
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *args, **kwargs: "n")
+
+    should_execute = asyncio.run(hil.request_tool_confirmation(
+        "srv.write", {"text": "x" * 10_000, "items": list(range(10_000))}
+    ))
+
+    output = hil.console.file.getvalue()
+    assert should_execute is False
+    assert "x" * 60 not in output
+    assert "[0, 1, 2, ...]" in output
+    assert "Tool call skipped" in output
+
+
+def test_disable_choice_asks_about_current_call(monkeypatch):
+    """Test that disabling HIL still asks whether to run the pending call."""
+    hil = make_hil()
+    answers = iter(["disable", "yes"])
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *args, **kwargs: next(answers))
+
+    should_execute = asyncio.run(hil.request_tool_confirmation("srv.write", {}))
+
+    assert should_execute is True
+    assert hil.is_enabled() is False
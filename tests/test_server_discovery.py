@@ -1,18 +1,37 @@
 """Test server discovery functionality."""
 
+import pytest
+
 from mcp_client_for_ollama.server.discovery import process_server_urls
 
 
-def test_process_server_urls():
-    """Test that server URL processing works correctly."""
-    # Test single URL string
-    result = process_server_urls("http://localhost:8000/sse")
+@pytest.mark.parametrize("url,expected_name,expected_type", [
+    # Path doesn't affect name, only hostname matters
+    ("http://localhost:8000/sse", "localhost_8000", "sse"),
+    ("http://localhost:8000/api/mcp", "localhost_8000", "streamable_http"),
+    ("http://localhost:9000", "localhost_9000", "streamable_http"),
+    # Hosts containing dots (IP addresses and domains) generate names without dots
+    ("https://127.0.0.1:8443/mcp/v1", "127_0_0_1_8443", "streamable_http"),
+    ("http://127.0.0.1:8000/mcp", "127_0_0_1_8000", "streamable_http"),
+    ("https://api.example.com:8080/mcp", "api_example_com_8080", "streamable_http"),
+    # SSE detection by URL content
+    ("http://localhost:8000/api/sse/endpoint", "localhost_8000", "sse"),
+    # Default to streamable_http for generic URLs
+    ("http://localhost:8000/mcp", "localhost_8000", "streamable_http"),
+    ("https://api.example.com", "api_example_com", "streamable_http"),
+])
+def test_process_single_server_url(url, expected_name, expected_type):
+    """Test that a single URL gets the expected name and server type."""
+    result = process_server_urls(url)
+
     assert len(result) == 1
-    assert result[0]["type"] == "sse"
-    assert result[0]["url"] == "http://localhost:8000/sse"
-    assert result[0]["name"] == "localhost_8000"
+    assert result[0]["url"] == url
+    assert result[0]["name"] == expected_name
+    assert result[0]["type"] == expected_type
+
 
-    # Test list of URLs
+def test_process_server_url_list():
+    """Test that a list of URLs is processed with per-URL type detection."""
     urls = [
         "http://localhost:8000/sse",
         "https://api.example.com/mcp",
@@ -29,37 +48,15 @@ def test_process_server_urls():
     http_server = next(s for s in result if s["url"] == "https://api.example.com/mcp")
     assert http_server["type"] == "streamable_http"
 
-    # Test invalid URLs are filtered out
-    invalid_urls = ["not-a-url", "ftp://invalid.com", ""]
-    result = process_server_urls(invalid_urls)
-    assert len(result) == 0
-
-    # Test empty input
-    assert process_server_urls([]) == []
-    assert process_server_urls(None) == []
-
-
-def test_server_url_name_generation():
-    """Test that server names are generated correctly from URLs."""
-    # Test with path - path doesn't affect name, only hostname matters
-    result = process_server_urls("http://localhost:8000/api/mcp")
-    assert result[0]["name"] == "localhost_8000"
-
-    # Test with SSE path
-    result = process_server_urls("http://localhost:8000/sse")
-    assert result[0]["name"] == "localhost_8000"
 
-    # Test without path
-    result = process_server_urls("http://localhost:9000")
-    assert result[0]["name"] == "localhost_9000"
-
-    # Test with complex host including dots (IP address)
-    result = process_server_urls("https://127.0.0.1:8443/mcp/v1")
-    assert result[0]["name"] == "127_0_0_1_8443"
-
-    # Test with domain containing dots
-    result = process_server_urls("https://api.example.com:8080/mcp")
-    assert result[0]["name"] == "api_example_com_8080"
+@pytest.mark.parametrize("urls", [
+    ["not-a-url", "ftp://invalid.com", ""],
+    [],
+    None,
+])
+def test_invalid_or_empty_urls(urls):
+    """Test that invalid URLs are filtered out and empty input yields no servers."""
+    assert process_server_urls(urls) == []
 
 
 def test_server_name_uniqueness():
@@ -97,34 +94,15 @@ def test_same_host_different_types():
     assert "streamable_http" in types
 
 
-def test_ip_address_name_generation():
-    """Test that IP addresses in URLs generate proper names without dots."""
+def test_ip_address_tool_name_parsing():
+    """Test that tool names built from IP-based server names split correctly."""
     # This is the specific case that was causing the parsing issue
     result = process_server_urls("http://127.0.0.1:8000/mcp")
-    assert result[0]["name"] == "127_0_0_1_8000"
 
     # Test tool name parsing with the generated name
     tool_name = f"{result[0]['name']}.hello_world"
-    server_name, actual_tool_name = tool_name.split('.', 1) if '.' in tool_name else (None, tool_name)
+    head, sep, tail = tool_name.partition('.')
+    server_name, actual_tool_name = (head, tail) if sep else (None, head)
 
     assert server_name == "127_0_0_1_8000"
     assert actual_tool_name == "hello_world"
-
-
-def test_server_type_detection():
-    """Test that server types are detected correctly."""
-    # SSE detection by path
-    result = process_server_urls("http://localhost:8000/sse")
-    assert result[0]["type"] == "sse"
-
-    # SSE detection by URL content
-    result = process_server_urls("http://localhost:8000/api/sse/endpoint")
-    assert result[0]["type"] == "sse"
-
-    # Default to streamable_http
-    result = process_server_urls("http://localhost:8000/mcp")
-    assert result[0]["type"] == "streamable_http"
-
-    # Default to streamable_http for generic URLs
-    result = process_server_urls("https://api.example.com")
-    assert result[0]["type"] == "streamable_http"
@@ -0,0 +1,142 @@
+"""Test streaming response handling."""
+
+import asyncio
+import io
+from types import SimpleNamespace
+
+from rich.console import Console
+
+from mcp_client_for_ollama.utils import metrics, streaming
+from mcp_client_for_ollama.utils.streaming import StreamingManager
+
+
+def make_chunk(content=None, thinking=None, tool_calls=None, done=False):
+    """Create a minimal streamed chunk with the given message fields."""
+    message = SimpleNamespace(content=content, thinking=thinking, tool_calls=tool_calls)
+    return SimpleNamespace(message=message, done=done)
+
+
+async def iterate(chunks):
+    """Yield the given chunks as an async stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+def run_stream(manager, chunks, **kwargs):
+    """Run process_streaming_response over the given chunks."""
+    return asyncio.run(manager.process_streaming_response(iterate(chunks), **kwargs))
+
+
+def test_silent_stream_accumulates_content_and_tool_calls():
+    """Test that silent processing collects text, thinking and tool calls."""
+    manager = StreamingManager(Console(file=io.StringIO()))
+    tool_call = object()
+    chunks = [
+        make_chunk(thinking="hmm"),
+        make_chunk(content="Hello"),
+        make_chunk(content=" world", tool_calls=[tool_call]),
+    ]
+
+    text, tool_calls, metrics = run_stream(manager, chunks, print_response=False, thinking_mode=True)
+
+    assert text == "Hello world"
+    assert tool_calls == [tool_call]
+    assert metrics is None
+
+
+def test_live_rendering_is_throttled(monkeypatch):
+    """Test that content bursts are rendered once plus a final flush."""
+    manager = StreamingManager(Console(file=io.StringIO(), force_terminal=True))
+    renders = []
+    create_display = manager._create_content_display
+
+    def counting_display(content, *args, **kwargs):
+        renders.append(content)
+        return create_display(content, *args, **kwargs)
+
+    monkeypatch.setattr(manager, "_create_content_display", counting_display)
+    monkeypatch.setattr(streaming, "_clock", lambda: 100.0)
+
+    text, _, _ = run_stream(manager, [make_chunk(content=str(i)) for i in range(50)])
+
+    assert text == "".join(str(i) for i in range(50))
+    assert renders == ["0", text]
+
+
+def test_throttled_content_is_drawn_during_a_pause(monkeypatch):
+    """Test that content held back by the throttle is drawn without waiting for the next chunk."""
+    manager = StreamingManager(Console(file=io.StringIO(), force_terminal=True))
+    renders = []
+    seen_during_pause = []
+    create_display = manager._create_content_display
+
+    def counting_display(content, *args, **kwargs):
+        renders.append(content)
+        return create_display(content, *args, **kwargs)
+
+    async def pausing_stream():
+        yield make_chunk(content="Hello")
+        yield make_chunk(content=" world")
+        # e.g. the model is preparing a tool call
+        await asyncio.sleep(streaming._RENDER_INTERVAL * 3)
+        seen_during_pause.extend(renders)
+        yield make_chunk(done=True)
+
+    monkeypatch.setattr(manager, "_create_content_display", counting_display)
+
+    asyncio.run(manager.process_streaming_response(pausing_stream()))
+
+    assert seen_during_pause == ["Hello", "Hello world"]
+
+
+def test_text_mode_appends_without_markdown(monkeypatch):
+    """Test that markdown=False streams into a Text buffer instead of Markdown."""
+    manager = StreamingManager(Console(file=io.StringIO(), force_terminal=True))
+    monkeypatch.setattr(manager, "_create_content_display", None)
+    chunks = [make_chunk(content="**Hello**"), make_chunk(content=" world", done=True)]
+
+    text, _, _ = run_stream(manager, chunks, markdown=False)
+
+    assert text == "**Hello** world"
+    assert "**Hello** world" in manager.console.file.getvalue()
+
+
+def test_piped_output_streams_plain_text(monkeypatch):
+    """Test that non-terminal consoles get raw content without Markdown rendering."""
+    manager = StreamingManager(Console(file=io.StringIO()))
+    monkeypatch.setattr(manager, "_create_content_display", None)
+    chunks = [make_chunk(content="**Hello**"), make_chunk(content=" world", done=True)]
+
+    text, _, _ = run_stream(manager, chunks)
+
+    assert text == "**Hello** world"
+    assert manager.console.file.getvalue() == "**Hello** world\n"
+
+
+def test_extract_metrics_only_on_done_chunks():
+    """Test that metrics are read from final chunks only."""
+    fields = dict.fromkeys(metrics._METRIC_FIELDS, 1)
+
+    assert metrics.extract_metrics(SimpleNamespace(done=False, **fields)) is None
+    assert metrics.extract_metrics(SimpleNamespace(done=True, **fields)) == fields
+    assert metrics.extract_metrics(SimpleNamespace(done=True)) is None
+
+
+def test_display_metrics_skips_missing_values():
+    """Test that only available metrics and rates are displayed."""
+    console = Console(file=io.StringIO(), width=120)
+
+    metrics.display_metrics(console, {
+        'total_duration': 2_000_000_000,
+        'load_duration': None,
+        'prompt_eval_count': None,
+        'prompt_eval_duration': None,
+        'eval_count': 10,
+        'eval_duration': 500_000_000,
+    })
+
+    output = console.file.getvalue()
+    assert "total duration:       2.000000000s" in output
+    assert "eval rate:            20.00 tokens/s" in output
+    assert "load duration" not in output
+    assert "prompt eval" not in output
@@ -0,0 +1,91 @@
+"""Test tool call display formatting."""
+
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from mcp_client_for_ollama.utils import tool_display
+from mcp_client_for_ollama.utils.tool_display import ToolDisplayManager
+
+
+def make_display():
+    """Create a ToolDisplayManager that writes to an in-memory console."""
+    return ToolDisplayManager(Console(file=io.StringIO(), width=120))
+
+
+def test_response_reuses_formatted_args(monkeypatch):
+    """Test that arguments are formatted once per execution/response pair."""
+    display = make_display()
+    formatted = []
+    format_json = display._format_json_obj
+
+    def counting_format(data):
+        formatted.append(data)
+        return format_json(data)
+
+    monkeypatch.setattr(display, "_format_json_obj", counting_format)
+    tool_args = {"path": "/tmp"}
+
+    display.display_tool_execution("srv.read", tool_args)
+    display.display_tool_response("srv.read", tool_args, "plain text")
+
+    assert formatted == [tool_args]
+    assert display._last_args[0] is tool_args
+    assert "plain text" in display.console.file.getvalue()
+
+
+def test_json_response_parsed_once(monkeypatch):
+    """Test that a JSON response is formatted from the already-parsed value."""
+    display = make_display()
+    parsed = []
+    loads = tool_display._loads
+
+    def counting_loads(data, *args, **kwargs):
+        parsed.append(data)
+        return loads(data, *args, **kwargs)
+
+    monkeypatch.setattr(tool_display, "_loads", counting_loads)
+
+    display.display_tool_response("srv.read", {}, '{"ok": true}')
+
+    assert parsed == ['{"ok": true}']
+    assert '"ok": true' in display.console.file.getvalue()
+
+
+def test_failed_call_args_are_not_retained():
+    """Test that a tool call without a response does not keep its arguments."""
+    display = make_display()
+    failed_args = {"path": "/missing"}
+    tool_args = {"path": "/tmp"}
+
+    display.display_tool_execution("srv.read", failed_args)
+    display.display_tool_execution("srv.read", tool_args)
+
+    assert display._last_args[0] is tool_args
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dumps_output_does_not_depend_on_orjson(monkeypatch, use_orjson):
+    """Test that formatted JSON is the same with and without the fast extra."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(tool_display, "orjson", None)
+    data = {"name": "café", "items": [1, 2.5, {}], "empty": []}
+
+    assert tool_display._dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+    # orjson rejects non-str keys and integers beyond 64 bits; json formats them instead
+    assert tool_display._dumps({1: 2 ** 70}) == '{\n  "1": 1180591620717411303424\n}'
+
+
+def test_orjson_response_with_nan_is_shown_as_text(monkeypatch):
+    """Test that responses orjson cannot parse, such as NaN, are displayed verbatim."""
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(tool_display, "_loads", orjson.loads)
+    display = make_display()
+
+    display.display_tool_response("srv.read", {}, '{"value": NaN}')
+
+    assert '{"value": NaN}' in display.console.file.getvalue()
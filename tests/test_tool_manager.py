@@ -0,0 +1,238 @@
+"""Test tool management functionality."""
+
+import io
+
+from mcp import Tool
+from rich.console import Console
+from rich.text import Text
+
+from mcp_client_for_ollama.tools.manager import ToolManager, _iter_selection
+
+
+def make_tool(name):
+    """Create a minimal MCP tool with the given qualified name."""
+    return Tool(name=name, description=f"{name} description", inputSchema={"type": "object"})
+
+
+def make_manager(tool_names):
+    """Create a ToolManager with all the given tools enabled."""
+    manager = ToolManager(console=Console(file=io.StringIO()))
+    manager.set_available_tools([make_tool(name) for name in tool_names])
+    manager.set_enabled_tools({name: True for name in tool_names})
+    return manager
+
+
+def test_tools_grouped_by_server():
+    """Test that tools are grouped and sorted by server name."""
+    manager = make_manager(["zeta.one", "alpha.two", "alpha.three", "plain"])
+
+    servers = [(name, [tool.name for tool in tools]) for name, tools in manager._sorted_servers]
+    assert servers == [
+        ("alpha", ["alpha.two", "alpha.three"]),
+        ("default", ["plain"]),
+        ("zeta", ["zeta.one"]),
+    ]
+
+
+def test_grouping_refreshed_on_set_available_tools():
+    """Test that the server grouping follows the available tools."""
+    manager = make_manager(["alpha.one"])
+    manager.set_available_tools([make_tool("beta.one")])
+
+    assert [name for name, _ in manager._sorted_servers] == ["beta"]
+
+
+def test_iter_selection():
+    """Test that selections are parsed into numbers, ranges and invalid parts."""
+    assert list(_iter_selection("1,3,5-8")) == [1, 3, (5, 8)]
+    assert list(_iter_selection(" 12 - 15 ,x7,, 4 ")) == [(12, 15), "x7", 4]
+    assert list(_iter_selection("1 2,3-,1-2-3")) == ["1 2", "3-", "1-2-3"]
+    assert list(_iter_selection("")) == []
+
+
+def test_process_tool_selection_numbers_and_ranges():
+    """Test that numbers and ranges toggle the mapped tools."""
+    names = ["srv.a", "srv.b", "srv.c", "srv.d"]
+    manager = make_manager(names)
+    index_to_tool = {i + 1: tool for i, tool in enumerate(manager.available_tools)}
+
+    message, style = manager._process_tool_selection("1, 3-4", index_to_tool, None)
+
+    assert style == "green"
+    assert "toggled 3 tools" in message
+    assert manager.enabled_tools == {"srv.a": False, "srv.b": True, "srv.c": False, "srv.d": False}
+
+
+def test_process_tool_selection_invalid_input():
+    """Test that invalid parts are reported and nothing is toggled."""
+    manager = make_manager(["srv.a"])
+    index_to_tool = {1: manager.available_tools[0]}
+
+    message, style = manager._process_tool_selection("x, 9", index_to_tool, None)
+
+    assert style == "red"
+    assert manager.enabled_tools == {"srv.a": True}
+
+    message, style = manager._process_tool_selection("1,abc", index_to_tool, None)
+
+    assert style == "green"
+    assert "abc" in message
+
+
+class RecordingConnector:
+    """Server connector stub that records the calls it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    def set_tool_status(self, tool_name, enabled):
+        self.calls.append(("set_tool_status", {tool_name: enabled}))
+
+    def set_tool_statuses(self, tool_status):
+        self.calls.append(("set_tool_statuses", dict(tool_status)))
+
+
+def test_disable_all_tools_notifies_connector_once():
+    """Test that bulk changes reach the server connector in a single call."""
+    manager = make_manager(["srv.a", "srv.b", "srv.c"])
+    connector = RecordingConnector()
+    manager.set_server_connector(connector)
+
+    manager.disable_all_tools()
+
+    assert connector.calls == [
+        ("set_tool_statuses", {"srv.a": False, "srv.b": False, "srv.c": False}),
+    ]
+
+
+def test_select_tools_quit_reverts_changes(monkeypatch):
+    """Test that quitting the selection restores states and notifies the connector."""
+    manager = make_manager(["srv.a", "srv.b"])
+    connector = RecordingConnector()
+    manager.set_server_connector(connector)
+    inputs = iter(["1", "q"])
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *args, **kwargs: next(inputs))
+
+    manager.select_tools()
+
+    assert manager.enabled_tools == {"srv.a": True, "srv.b": True}
+    assert connector.calls[-1] == ("set_tool_statuses", {"srv.a": True})
+
+
+def test_select_tools_commands(monkeypatch):
+    """Test that command aliases are dispatched until the user saves."""
+    manager = make_manager(["srv.a", "srv.b"])
+    inputs = iter(["n", "d", "a", "2", "save"])
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *args, **kwargs: next(inputs))
+
+    manager.select_tools()
+
+    assert manager.enabled_tools == {"srv.a": True, "srv.b": False}
+    assert manager._show_descriptions is True
+
+
+def test_enabled_tool_objects_cache_invalidated_on_change():
+    """Test that enabled tool objects are cached until a tool state changes."""
+    manager = make_manager(["srv.a", "srv.b"])
+
+    first = manager.get_enabled_tool_objects()
+    assert manager.get_enabled_tool_objects() is first
+    assert [tool.name for tool in first] == ["srv.a", "srv.b"]
+
+    manager.set_tool_status("srv.a", False)
+    assert [tool.name for tool in manager.get_enabled_tool_objects()] == ["srv.b"]
+
+    manager.enable_all_tools()
+    assert len(manager.get_enabled_tool_objects()) == 2
+
+
+def test_server_panels_reused_until_tool_state_changes():
+    """Test that server panels are rebuilt only when their tool states change."""
+    manager = make_manager(["srv.a", "srv.b"])
+    server_name, server_tools = manager._sorted_servers[0]
+
+    index_to_tool = {}
+    assert manager._display_server_tools(server_name, 0, server_tools, False, index_to_tool, 1) == 3
+    assert index_to_tool == {1: server_tools[0], 2: server_tools[1]}
+    first_panel = next(iter(manager._panel_cache.values()))
+
+    manager._display_server_tools(server_name, 0, server_tools, False, {}, 1)
+    assert list(manager._panel_cache.values()) == [first_panel]
+
+    manager.set_tool_status("srv.a", False)
+    manager._display_server_tools(server_name, 0, server_tools, False, {}, 1)
+    assert len(manager._panel_cache) == 2
+
+
+def test_server_bitmaps_track_tool_states():
+    """Test that per-server bitmaps follow individual and bulk changes."""
+    manager = make_manager(["one.a", "one.b", "two.c"])
+    assert manager._server_bitmap == {"one": 0b11, "two": 0b1}
+    assert manager._server_mask == {"one": 0b11, "two": 0b1}
+
+    manager.set_tool_status("one.b", False)
+    assert manager._server_bitmap["one"] == 0b01
+
+    message, _ = manager._process_server_toggle("s1", manager._sorted_servers, None)
+    assert "enabled" in message
+    assert manager._server_bitmap["one"] == 0b11
+
+    manager.disable_all_tools()
+    assert manager._server_bitmap == {"one": 0, "two": 0}
+
+
+def test_bulk_changes_only_notify_changed_tools():
+    """Test that enable/disable all only touch tools not yet in the target state."""
+    manager = make_manager(["one.a", "one.b", "two.c"])
+    connector = RecordingConnector()
+    manager.set_server_connector(connector)
+
+    manager.enable_all_tools()
+    assert connector.calls == []
+
+    manager.set_tool_status("one.b", False)
+    manager.enable_all_tools()
+    assert connector.calls[-1] == ("set_tool_statuses", {"one.b": True})
+    assert all(manager.enabled_tools.values())
+
+
+def test_enabled_tools_are_not_shared_with_caller():
+    """Test that writes to the caller's dict cannot leave the bitmaps stale."""
+    manager = make_manager(["srv.a", "srv.b"])
+    shared = {"srv.a": True, "srv.b": True}
+
+    manager.set_enabled_tools(shared)
+    shared["srv.a"] = False
+    manager.enable_all_tools()
+
+    assert manager.enabled_tools == {"srv.a": True, "srv.b": True}
+    assert [tool.name for tool in manager.get_enabled_tool_objects()] == ["srv.a", "srv.b"]
+
+
+def test_process_tool_selection_clamps_large_ranges():
+    """Test that out-of-range parts of a range are reported once as a span."""
+    manager = make_manager(["srv.a", "srv.b", "srv.c"])
+    index_to_tool = {i + 1: tool for i, tool in enumerate(manager.available_tools)}
+
+    message, style = manager._process_tool_selection("0-2, 2-2000000", index_to_tool, None)
+
+    assert style == "green"
+    assert message.plain == (
+        "Successfully toggled 4 tools!\n"
+        "Warning: Invalid indices ignored: 0, 4-2000000"
+    )
+    assert manager.enabled_tools == {"srv.a": False, "srv.b": True, "srv.c": False}
+
+
+def test_bulk_commands_return_text_messages():
+    """Test that the all/none/desc commands return prebuilt Text like the toggles."""
+    manager = make_manager(["srv.a"])
+
+    for handler, expected in [
+        (manager._cmd_none, ("All tools disabled!", "yellow")),
+        (manager._cmd_all, ("All tools enabled!", "green")),
+        (manager._cmd_desc, ("Tool descriptions shown!", "blue")),
+    ]:
+        message, style = handler(None)
+        assert isinstance(message, Text)
+        assert (message.plain, style) == expected
@@ -1,6 +1,15 @@
 """Test version consistency in the package."""
 
+import io
+import json
+import time
+import urllib.error
+
+import pytest
+
 import mcp_client_for_ollama
+from mcp_client_for_ollama.utils import version
+from mcp_client_for_ollama.utils.version import _parse_version
 
 
 def test_version_exists():
@@ -8,3 +17,181 @@ def test_version_exists():
     assert hasattr(mcp_client_for_ollama, "__version__")
     assert isinstance(mcp_client_for_ollama.__version__, str)
     assert mcp_client_for_ollama.__version__ != ""
+
+
+def test_parse_version():
+    """Test that dotted and non-dotted versions parse to integer tuples."""
+    assert _parse_version("0.16.0") == (0, 16, 0)
+    assert _parse_version("1.2.10") > _parse_version("1.2.9")
+    assert _parse_version("1.0.0rc1") == (1, 0, 0, 1)
+    # Non-ASCII digits such as superscripts are not version numbers
+    assert _parse_version("1.2.³") == (1, 2)
+
+
+class FakeResponse(io.BytesIO):
+    """urlopen response stand-in carrying a JSON body and headers."""
+
+    def __init__(self, body, headers):
+        super().__init__(json.dumps(body).encode())
+        self.headers = headers
+
+
+@pytest.fixture(autouse=True)
+def reset_last_check(monkeypatch):
+    """Clear the memoized update check result so tests do not depend on their order."""
+    monkeypatch.setattr(version, "_last_check", None)
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the update check cache at a temporary file."""
+    path = tmp_path / "version_check.json"
+    monkeypatch.setattr(version, "VERSION_CHECK_CACHE_FILE", str(path))
+    return path
+
+
+def test_update_check_uses_fresh_cache(cache_file, monkeypatch):
+    """Test that a fresh cache entry answers without contacting PyPI."""
+    cache_file.write_text(json.dumps({"latest": "999.0.0", "etags": {}, "timestamp": time.time()}))
+    requests = []
+    monkeypatch.setattr(version.urllib.request, "urlopen", lambda request, timeout: requests.append(request))
+
+    version.start_update_check().join()
+    assert requests == []
+    assert version.check_for_updates() == (True, mcp_client_for_ollama.__version__, "999.0.0")
+
+
+def test_update_check_stores_version_and_etag(cache_file, monkeypatch):
+    """Test that the newest non-yanked release from the simple index is cached with its ETag."""
+    sent_headers = {}
+
+    def simple_index(request, timeout):
+        sent_headers.update(request.headers)
+        body = {
+            "versions": ["0.1.0", "10.0.0", "999.0.0", "1000.0.0", "1001.0.0rc1"],
+            "files": [
+                {"filename": "mcp-client-for-ollama-0.1.0.tar.gz", "yanked": False},
+                {"filename": "mcp_client_for_ollama-10.0.0-py3-none-any.whl", "yanked": False},
+                {"filename": "mcp_client_for_ollama-999.0.0-py3-none-any.whl", "yanked": False},
+                {"filename": "mcp_client_for_ollama-999.0.0.tar.gz", "yanked": "broken sdist"},
+                {"filename": "mcp_client_for_ollama-1000.0.0-py3-none-any.whl", "yanked": "bad release"},
+                {"filename": "mcp_client_for_ollama-1001.0.0rc1.tar.gz", "yanked": False},
+                {"filename": "mcp_client_for_ollama-2000.0.²-py3-none-any.whl", "yanked": False},
+            ],
+        }
+        return FakeResponse(body, {"ETag": '"abc"'})
+
+    monkeypatch.setattr(version.urllib.request, "urlopen", simple_index)
+
+    assert version.check_for_updates()[2] == mcp_client_for_ollama.__version__
+    version.start_update_check().join()
+    assert version.check_for_updates()[2] == "999.0.0"
+
+    cache = json.loads(cache_file.read_text())
+    assert (cache["latest"], cache["etags"]) == ("999.0.0", {version.PYPI_SIMPLE_URL: '"abc"'})
+    assert sent_headers["Accept"] == "application/vnd.pypi.simple.v1+json"
+
+
+def test_update_check_falls_back_to_json_api(cache_file, monkeypatch):
+    """Test that the JSON API is used when the simple index is unavailable."""
+    urls = []
+
+    def json_api_only(request, timeout):
+        urls.append(request.full_url)
+        if request.full_url == version.PYPI_SIMPLE_URL:
+            raise urllib.error.HTTPError(request.full_url, 406, "Not Acceptable", {}, None)
+        return FakeResponse({"info": {"version": "999.0.0"}, "releases": {}}, {})
+
+    monkeypatch.setattr(version.urllib.request, "urlopen", json_api_only)
+
+    version.start_update_check().join()
+
+    assert urls == [version.PYPI_SIMPLE_URL, version.PYPI_PACKAGE_URL]
+    assert version.check_for_updates()[2] == "999.0.0"
+
+
+def test_update_check_revalidates_stale_cache(cache_file, monkeypatch):
+    """Test that a stale entry is revalidated with If-None-Match and reused on 304."""
+    cache_file.write_text(json.dumps({
+        "latest": "999.0.0", "etags": {version.PYPI_SIMPLE_URL: '"abc"'}, "timestamp": 0,
+    }))
+    sent_headers = {}
+
+    def not_modified(request, timeout):
+        sent_headers.update(request.headers)
+        raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+
+    monkeypatch.setattr(version.urllib.request, "urlopen", not_modified)
+
+    version.start_update_check().join()
+    assert version.check_for_updates()[2] == "999.0.0"
+    assert sent_headers["If-none-match"] == '"abc"'
+    assert json.loads(cache_file.read_text())["timestamp"] > 0
+
+
+def test_extract_latest_version():
+    """Test that info.version is found in the raw body, ignoring other version fields."""
+    body = json.dumps({
+        "info": {"description": 'set "version": "0.0.1"', "version": "1.2.3"},
+        "urls": [{"python_version": "py3"}],
+    }).encode()
+
+    assert version._extract_latest_version(body) == "1.2.3"
+    assert version._extract_latest_version(b'{"info": {"version" : "2.0.0"}}') == "2.0.0"
+
+
+def test_update_check_skipped_while_offline(cache_file, monkeypatch):
+    """Test that a connection failure is cached and suppresses requests for a while."""
+    urls = []
+
+    def unreachable(request, timeout):
+        urls.append(request.full_url)
+        raise urllib.error.URLError("Name or service not known")
+
+    monkeypatch.setattr(version.urllib.request, "urlopen", unreachable)
+
+    version.start_update_check().join()
+    version.start_update_check().join()
+
+    assert urls == [version.PYPI_SIMPLE_URL]
+    assert json.loads(cache_file.read_text()).keys() == {"offline_timestamp"}
+
+
+def test_write_cache_replaces_file_atomically(cache_file, monkeypatch):
+    """Test that a failed cache write leaves the previous entry and no temp file."""
+    version._write_cache({"latest": "1.0.0"})
+
+    def failing_dump(obj, f):
+        f.write('{"latest": ')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(version.json, "dump", failing_dump)
+    version._write_cache({"latest": "2.0.0"})
+
+    assert json.loads(cache_file.read_text()) == {"latest": "1.0.0"}
+    assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
+
+
+def test_etags_are_kept_per_endpoint(cache_file, monkeypatch):
+    """Test that the JSON API is not revalidated with the simple index's ETag."""
+    cache_file.write_text(json.dumps({
+        "latest": "999.0.0", "etags": {version.PYPI_SIMPLE_URL: '"simple"'}, "timestamp": 0,
+    }))
+    sent = {}
+
+    def json_api_only(request, timeout):
+        sent[request.full_url] = request.headers.get("If-none-match")
+        if request.full_url == version.PYPI_SIMPLE_URL:
+            raise urllib.error.HTTPError(request.full_url, 406, "Not Acceptable", {}, None)
+        return FakeResponse({"info": {"version": "1000.0.0"}}, {"ETag": '"json"'})
+
+    monkeypatch.setattr(version.urllib.request, "urlopen", json_api_only)
+
+    version.start_update_check().join()
+
+    assert sent == {version.PYPI_SIMPLE_URL: '"simple"', version.PYPI_PACKAGE_URL: None}
+    assert json.loads(cache_file.read_text())["etags"] == {
+        version.PYPI_SIMPLE_URL: '"simple"',
+        version.PYPI_PACKAGE_URL: '"json"',
+    }
+    assert version.check_for_updates()[2] == "1000.0.0"